@@ -1,68 +1,424 @@
 """Canvas LMS API wrapper."""
 
+import hashlib
+import json
+import os
+import socket
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from threading import Lock, Thread
+from typing import Optional, Iterator, Any, Callable, Iterable, Union
+from urllib.parse import urlsplit
+
 import requests
-from typing import Optional, Iterator, Any
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+_MISSING = object()
+
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire after ttl seconds."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: tuple) -> Any:
+        """Return the cached value for key, or _MISSING."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return _MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: tuple, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Drop entries for an endpoint and everything nested below it."""
+        prefix = prefix.strip("/")
+        with self._lock:
+            stale = [key for key in self._data
+                     if key[0] == prefix or key[0].startswith(prefix + "/")]
+            for key in stale:
+                del self._data[key]
+
+
+class _ETagStore:
+    """On-disk store of (ETag, body) pairs used to revalidate GETs.
+
+    Entries are keyed by a hash of the API token and the full request URL,
+    so each page of a paginated listing is validated independently and
+    different Canvas users never share entries.
+    """
+
+    def __init__(self, directory: Union[str, Path], api_token: str):
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._salt = hashlib.sha256(api_token.encode()).hexdigest()
+
+    def _path(self, url: str) -> Path:
+        digest = hashlib.sha256(f"{self._salt} {url}".encode()).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, url: str) -> Optional[dict]:
+        """Return the stored {"etag", "body", "next"} entry for url, if any."""
+        try:
+            return _loads(self._path(url).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def set(self, url: str, etag: str, body: str, next_url: Optional[str]) -> None:
+        """Store the validator and body for url, replacing any previous entry."""
+        path = self._path(url)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(
+                json.dumps({"etag": etag, "body": body, "next": next_url}),
+                encoding="utf-8"
+            )
+            os.replace(tmp_path, path)
+        except OSError:
+            # The cache is an optimisation; never fail a request over it
+            tmp_path.unlink(missing_ok=True)
+
+
+def _cache_key(endpoint: str, params: Optional[dict]) -> tuple:
+    """Build a hashable cache key from an endpoint and its query params."""
+    items = tuple(sorted(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in (params or {}).items()
+    ))
+    return (endpoint.strip("/"), items)
+
+
+_COURSE_OVERVIEW_QUERY = """
+query CourseOverview($id: ID!) {
+  course(id: $id) {
+    modulesConnection { nodes { _id name } }
+    assignmentsConnection { nodes { _id name dueAt } }
+    pagesConnection { nodes { _id title } }
+  }
+}
+"""
+
+# Fixed fields of every rubric association this client creates
+_RUBRIC_ASSOCIATION_DEFAULTS = {"association_type": "Assignment", "purpose": "grading"}
+
+_SUBMISSION_INCLUDES = ["submission_comments", "user", "attachments"]
+
+
+def _only(fields: Optional[list[str]]) -> dict:
+    """Query params restricting list endpoints to the given fields."""
+    return {"only[]": list(fields)} if fields else {}
+
+
+_original_getaddrinfo = socket.getaddrinfo
+_dns_cache = {}
+_dns_hosts = {}
+_dns_lock = Lock()
+
+
+def _caching_getaddrinfo(host, port, *args, **kwargs):
+    """socket.getaddrinfo that memoizes lookups for registered hosts."""
+    ttl = _dns_hosts.get(host)
+    if ttl is None:
+        return _original_getaddrinfo(host, port, *args, **kwargs)
+
+    key = (host, port, args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+    with _dns_lock:
+        entry = _dns_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    result = _original_getaddrinfo(host, port, *args, **kwargs)
+    with _dns_lock:
+        _dns_cache[key] = (now + ttl, result)
+    return result
+
+
+def install_dns_cache(url: str, ttl: float = 60) -> None:
+    """Resolve the host of url at most once per ttl seconds in this process.
+
+    Every new pooled connection otherwise repeats the DNS lookup. Only the
+    given host is cached; keep ttl at or below the DNS TTL of the Canvas
+    instance so failover to a new address is still picked up.
+    """
+    host = urlsplit(url).hostname
+    if not host:
+        return
+    with _dns_lock:
+        _dns_hosts[host] = ttl
+    socket.getaddrinfo = _caching_getaddrinfo
+
+
+def _make_session(api_token: str) -> requests.Session:
+    """Create the HTTP session shared by every request a CanvasAPI makes.
+
+    One keep-alive session means one TCP+TLS handshake per pooled
+    connection rather than per request, including across fan-out threads.
+    """
+    session = requests.Session()
+    session.headers.update({
+        # requests sets Content-Type itself for json= bodies
+        "Authorization": f"Bearer {api_token}",
+    })
+
+    # Enough pooled connections for the fan-out helpers, plus backoff on rate
+    # limiting and gateway errors. POST is left out of the retried methods
+    # because it creates objects (rubrics, associations) and is not idempotent.
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["HEAD", "GET", "PUT", "DELETE"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def iter_discussion_entries(data: dict) -> Iterator[tuple[dict, int]]:
+    """Walk a discussion view (see get_discussion_entries) in pre-order.
+
+    Yields (entry, depth) pairs, depth 0 for top-level posts, visiting each
+    post before its replies and replies in their original order. Uses an
+    explicit stack, so deeply nested threads need no recursion.
+    """
+    stack = [(entry, 0) for entry in reversed(data.get("view", []))]
+    while stack:
+        entry, depth = stack.pop()
+        yield entry, depth
+        stack.extend((reply, depth + 1) for reply in reversed(entry.get("replies") or []))
 
 
 class CanvasAPI:
     """Wrapper for Canvas LMS REST API."""
 
-    def __init__(self, base_url: str, api_token: str):
+    def __init__(self, base_url: str, api_token: str, max_workers: int = 8,
+                 cache_ttl: float = 300, etag_cache_dir: Optional[Union[str, Path]] = None):
         self.base_url = base_url.rstrip("/")
         self.api_url = f"{self.base_url}/api/v1"
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Authorization": f"Bearer {api_token}",
-            "Content-Type": "application/json"
-        })
+        # Prefix for endpoint paths, which are given without a leading slash
+        self._base = self.api_url + "/"
+        # Upper bound on concurrent requests issued by the fan-out helpers
+        self.max_workers = max_workers
+        # Short-lived cache for repeated GETs of the same object; 0 disables it
+        self._get_cache = _TTLCache(maxsize=1024, ttl=cache_ttl)
+        # GETs currently on the wire, so concurrent identical calls share one request
+        self._inflight = {}
+        self._inflight_lock = Lock()
+        self.session = _make_session(api_token)
+        # Optional persistent ETag cache so unchanged resources come back as 304s
+        self._etags = _ETagStore(etag_cache_dir, api_token) if etag_cache_dir else None
 
     def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make an API request."""
-        url = f"{self.api_url}/{endpoint.lstrip('/')}"
+        url = self._base + endpoint
+        if orjson is not None and "json" in kwargs:
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"))
+            kwargs["headers"] = {**kwargs.get("headers", {}), "Content-Type": "application/json"}
         response = self.session.request(method, url, **kwargs)
         response.raise_for_status()
+        if method != "GET":
+            self._invalidate_prefix(endpoint)
         return response
 
+    def _invalidate_prefix(self, endpoint: str) -> None:
+        """Forget cached GETs for an endpoint after it has been modified."""
+        self._get_cache.invalidate_prefix(endpoint)
+        # A cached course overview summarises everything below courses/<id>
+        parts = endpoint.strip("/").split("/")
+        if len(parts) >= 2 and parts[0] == "courses":
+            self._get_cache.invalidate_prefix(f"graphql/courses/{parts[1]}")
+
     def _get(self, endpoint: str, **kwargs) -> Any:
-        """GET request returning JSON."""
-        return self._request("GET", endpoint, **kwargs).json()
+        """GET request returning JSON.
+
+        Served from the TTL cache when fresh; concurrent callers asking for the
+        same endpoint while a request is in flight wait for that response
+        instead of issuing a duplicate.
+        """
+        key = _cache_key(endpoint, kwargs.get("params"))
+        cached = self._get_cache.get(key)
+        if cached is not _MISSING:
+            return cached
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+        if not is_owner:
+            return future.result()
+
+        try:
+            result, _ = self._fetch_json(self._base + endpoint, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            self._get_cache.set(key, result)
+            future.set_result(result)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        return result
 
     def _put(self, endpoint: str, **kwargs) -> Any:
         """PUT request returning JSON."""
-        return self._request("PUT", endpoint, **kwargs).json()
+        return _loads(self._request("PUT", endpoint, **kwargs).content)
 
     def _post(self, endpoint: str, **kwargs) -> Any:
         """POST request returning JSON."""
-        return self._request("POST", endpoint, **kwargs).json()
+        return _loads(self._request("POST", endpoint, **kwargs).content)
 
     def _delete(self, endpoint: str, **kwargs) -> Any:
         """DELETE request."""
         return self._request("DELETE", endpoint, **kwargs)
 
-    def _paginate(self, endpoint: str, **kwargs) -> Iterator[Any]:
-        """Iterate through paginated results."""
+    @staticmethod
+    def _parse_next(response: requests.Response) -> Optional[str]:
+        """Return the URL of the next page from the Link header, if any."""
+        return response.links.get("next", {}).get("url")
+
+    def _fetch_json(self, url: str, **kwargs) -> tuple[Any, Optional[str]]:
+        """GET url and return (parsed JSON, next page URL).
+
+        Only the parsed data leaves this function, so the raw response body
+        is released before the caller starts working through it. With an
+        ETag cache configured the request carries If-None-Match, and a 304
+        is answered from the stored body.
+        """
+        if self._etags is None:
+            response = self.session.get(url, **kwargs)
+            response.raise_for_status()
+            return _loads(response.content), self._parse_next(response)
+
+        prepared = requests.PreparedRequest()
+        prepared.prepare_url(url, kwargs.get("params"))
+        stored = self._etags.get(prepared.url)
+        if stored:
+            kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": stored["etag"]}
+
+        response = self.session.get(url, **kwargs)
+        if response.status_code == 304:
+            try:
+                return _loads(stored["body"]), stored["next"]
+            except (TypeError, KeyError, ValueError):
+                # No usable stored body (entry wiped or corrupt): ask once for the full body
+                headers = {k: v for k, v in kwargs.get("headers", {}).items() if k.lower() != "if-none-match"}
+                kwargs["headers"] = {**headers, "Cache-Control": "no-cache"}
+                response = self.session.get(url, **kwargs)
+                if response.status_code == 304:
+                    raise requests.HTTPError(f"304 Not Modified with no cached body for {url}", response=response)
+        response.raise_for_status()
+
+        next_url = self._parse_next(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etags.set(prepared.url, etag, response.text, next_url)
+        return _loads(response.content), next_url
+
+    def _iter_pages(self, endpoint: str, **kwargs) -> Iterator[list]:
+        """Iterate through the pages of a list endpoint.
+
+        The next page is fetched and parsed in the background as soon as the
+        current one arrives, so its round trip overlaps with the caller
+        consuming the current page.
+        """
         params = kwargs.pop("params", {})
         params.setdefault("per_page", 100)
 
-        url = f"{self.api_url}/{endpoint.lstrip('/')}"
+        url = self._base + endpoint
 
-        while url:
-            response = self.session.get(url, params=params, **kwargs)
-            response.raise_for_status()
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            items, next_url = self._fetch_json(url, params=params, **kwargs)
+            while True:
+                # Params are already encoded in the next URL
+                future = executor.submit(self._fetch_json, next_url, **kwargs) if next_url else None
+
+                yield items
+
+                if future is None:
+                    break
+                items, next_url = future.result()
+        finally:
+            executor.shutdown(wait=False)
+
+    def _paginate(self, endpoint: str, **kwargs) -> Iterator[Any]:
+        """Iterate through paginated results."""
+        for page in self._iter_pages(endpoint, **kwargs):
+            yield from page
+
+    def warm_up(self) -> None:
+        """Open a pooled connection to Canvas in the background.
+
+        Pays the TCP+TLS handshake while the caller does local work (parsing
+        files, converting markdown), so the first real request finds a warm
+        socket. Failures are ignored; the real request will report them.
+        """
+        def head():
+            try:
+                self.session.head(self._base + "users/self", timeout=5)
+            except requests.RequestException:
+                pass
+
+        Thread(target=head, daemon=True).start()
 
-            for item in response.json():
-                yield item
+    def parallel_map(self, func: Callable[[Any], Any], items: Iterable[Any],
+                     workers: Optional[int] = None) -> Iterator[Any]:
+        """Apply func to each item on a thread pool, yielding results in order.
 
-            # Get next page from Link header
-            url = None
-            params = {}  # Clear params for subsequent requests (they're in the URL)
-            if "Link" in response.headers:
-                links = response.headers["Link"].split(",")
-                for link in links:
-                    if 'rel="next"' in link:
-                        url = link.split(";")[0].strip(" <>")
-                        break
+        Calls are latency-bound, so overlapping them cuts wall time roughly by
+        the number of workers (default max_workers). All workers share this
+        client's session and connection pool; func must not mutate shared
+        state without its own locking.
+
+        Example: courses = list(api.parallel_map(api.get_course, course_ids))
+        """
+        workers = workers or self.max_workers
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(func, items)
+
+    def parallel_starmap(self, func: Callable[..., Any], arg_tuples: Iterable[tuple],
+                         workers: Optional[int] = None) -> Iterator[Any]:
+        """Like parallel_map, but call func(*args) for each args tuple.
+
+        Example: api.parallel_starmap(api.get_submission, [(cid, aid, uid) for uid in uids])
+        """
+        return self.parallel_map(lambda args: func(*args), arg_tuples, workers)
 
     # ==================== Courses ====================
 
@@ -74,11 +430,44 @@ class CanvasAPI:
         """Get a specific course."""
         return self._get(f"courses/{course_id}")
 
+    def graphql(self, query: str, variables: Optional[dict] = None) -> dict:
+        """Run a query against Canvas's GraphQL endpoint.
+
+        Returns the decoded response, including any "errors" Canvas reports
+        alongside partial "data".
+        """
+        response = self.session.post(
+            f"{self.base_url}/api/graphql",
+            json={"query": query, "variables": variables or {}}
+        )
+        response.raise_for_status()
+        return _loads(response.content)
+
+    def get_course_overview(self, course_id: int, query: str = _COURSE_OVERVIEW_QUERY) -> dict:
+        """Get a course's modules, assignments and pages in one round trip.
+
+        Replaces separate paginated walks of each list endpoint. Connections
+        return Canvas's first page of nodes, so very large courses may still
+        need the REST listings. Results share the GET cache.
+        """
+        key = (f"graphql/courses/{course_id}", (("query", query),))
+        cached = self._get_cache.get(key)
+        if cached is not _MISSING:
+            return cached
+
+        result = self.graphql(query, {"id": str(course_id)})
+        if result.get("errors"):
+            messages = "; ".join(error.get("message", "") for error in result["errors"])
+            raise ValueError(f"GraphQL query failed: {messages}")
+        overview = (result.get("data") or {}).get("course") or {}
+        self._get_cache.set(key, overview)
+        return overview
+
     # ==================== Modules ====================
 
-    def get_modules(self, course_id: int) -> Iterator[dict]:
+    def get_modules(self, course_id: int, fields: Optional[list[str]] = None) -> Iterator[dict]:
         """Get all modules in a course."""
-        return self._paginate(f"courses/{course_id}/modules")
+        return self._paginate(f"courses/{course_id}/modules", params=_only(fields))
 
     def get_module(self, course_id: int, module_id: int) -> dict:
         """Get a specific module."""
@@ -88,15 +477,33 @@ class CanvasAPI:
         """Get all items in a module."""
         return self._paginate(f"courses/{course_id}/modules/{module_id}/items")
 
+    def get_module_item_contents(self, course_id: int, items: Iterable[dict]) -> list:
+        """Fetch the page/assignment/discussion behind each module item concurrently.
+
+        Returns a list aligned with items; entries are None for item types
+        that have no fetchable content (headers, external links, files...).
+        """
+        def fetch(item: dict) -> Optional[dict]:
+            item_type = item.get("type")
+            if item_type == "Page":
+                return self.get_page(course_id, item["page_url"])
+            if item_type == "Assignment":
+                return self.get_assignment(course_id, item["content_id"])
+            if item_type == "Discussion":
+                return self.get_discussion_topic(course_id, item["content_id"])
+            return None
+
+        return list(self.parallel_map(fetch, items))
+
     def update_module(self, course_id: int, module_id: int, **kwargs) -> dict:
         """Update a module."""
         return self._put(f"courses/{course_id}/modules/{module_id}", json={"module": kwargs})
 
     # ==================== Pages ====================
 
-    def get_pages(self, course_id: int) -> Iterator[dict]:
+    def get_pages(self, course_id: int, fields: Optional[list[str]] = None) -> Iterator[dict]:
         """Get all pages in a course."""
-        return self._paginate(f"courses/{course_id}/pages")
+        return self._paginate(f"courses/{course_id}/pages", params=_only(fields))
 
     def get_page(self, course_id: int, page_url: str) -> dict:
         """Get a specific page by URL slug."""
@@ -112,9 +519,9 @@ class CanvasAPI:
 
     # ==================== Assignments ====================
 
-    def get_assignments(self, course_id: int) -> Iterator[dict]:
+    def get_assignments(self, course_id: int, fields: Optional[list[str]] = None) -> Iterator[dict]:
         """Get all assignments in a course."""
-        return self._paginate(f"courses/{course_id}/assignments")
+        return self._paginate(f"courses/{course_id}/assignments", params=_only(fields))
 
     def get_assignment(self, course_id: int, assignment_id: int) -> dict:
         """Get a specific assignment."""
@@ -147,23 +554,31 @@ class CanvasAPI:
         """Attach a rubric to an assignment via rubric association."""
         data = {
             "rubric_association": {
+                **_RUBRIC_ASSOCIATION_DEFAULTS,
                 "rubric_id": rubric_id,
                 "association_id": assignment_id,
-                "association_type": "Assignment",
                 "use_for_grading": use_for_grading,
-                "purpose": "grading"
             }
         }
-        return self._post(f"courses/{course_id}/rubric_associations", json=data)
+        result = self._post(f"courses/{course_id}/rubric_associations", json=data)
+        # The assignment's rubric settings changed along with the association
+        self._invalidate_prefix(f"courses/{course_id}/assignments/{assignment_id}")
+        return result
 
     # ==================== Submissions ====================
 
     def get_submissions(self, course_id: int, assignment_id: int,
-                        include_comments: bool = True) -> Iterator[dict]:
-        """Get all submissions for an assignment."""
+                        include: Optional[list[str]] = None) -> Iterator[dict]:
+        """Get all submissions for an assignment.
+
+        include selects which relations Canvas hydrates; by default comments,
+        user and attachments. Pass an empty list when only grades are needed.
+        """
+        if include is None:
+            include = _SUBMISSION_INCLUDES
         params = {"per_page": 100}
-        if include_comments:
-            params["include[]"] = ["submission_comments", "user", "attachments"]
+        if include:
+            params["include[]"] = list(include)
         return self._paginate(
             f"courses/{course_id}/assignments/{assignment_id}/submissions",
             params=params
@@ -189,11 +604,40 @@ class CanvasAPI:
             json=data
         )
 
+    def bulk_update_submissions(self, course_id: int, assignment_id: int, grades: dict) -> dict:
+        """Grade and/or comment on many submissions in a single request.
+
+        grades maps user IDs to dicts with "posted_grade" and/or "text_comment".
+        Canvas applies the update in the background and returns a Progress
+        object; pass its "url" to wait_for_progress() to block until it is done.
+        """
+        data = {"grade_data": {str(user_id): values for user_id, values in grades.items()}}
+        result = self._post(
+            f"courses/{course_id}/assignments/{assignment_id}/submissions/update_grades",
+            json=data
+        )
+        self._invalidate_prefix(f"courses/{course_id}/assignments/{assignment_id}/submissions")
+        return result
+
+    def wait_for_progress(self, progress_url: str, poll: float = 1.0,
+                          timeout: Optional[float] = None) -> dict:
+        """Poll a Progress URL until its workflow_state is completed or failed."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            response = self.session.get(progress_url)
+            response.raise_for_status()
+            progress = _loads(response.content)
+            if progress.get("workflow_state") in ("completed", "failed"):
+                return progress
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Progress did not finish within {timeout}s: {progress_url}")
+            time.sleep(poll)
+
     # ==================== Discussions ====================
 
-    def get_discussion_topics(self, course_id: int) -> Iterator[dict]:
+    def get_discussion_topics(self, course_id: int, fields: Optional[list[str]] = None) -> Iterator[dict]:
         """Get all discussion topics in a course."""
-        return self._paginate(f"courses/{course_id}/discussion_topics")
+        return self._paginate(f"courses/{course_id}/discussion_topics", params=_only(fields))
 
     def get_discussion_topic(self, course_id: int, topic_id: int) -> dict:
         """Get a specific discussion topic."""
@@ -209,14 +653,16 @@ class CanvasAPI:
         Returns a dict with:
         - 'participants': list of user info dicts
         - 'view': list of top-level entry dicts, each with nested 'replies'
+
+        Use iter_discussion_entries() to walk the nested replies.
         """
         return self._get(f"courses/{course_id}/discussion_topics/{topic_id}/view")
 
     # ==================== Quizzes ====================
 
-    def get_quizzes(self, course_id: int) -> Iterator[dict]:
+    def get_quizzes(self, course_id: int, fields: Optional[list[str]] = None) -> Iterator[dict]:
         """Get all quizzes in a course."""
-        return self._paginate(f"courses/{course_id}/quizzes")
+        return self._paginate(f"courses/{course_id}/quizzes", params=_only(fields))
 
     def get_quiz(self, course_id: int, quiz_id: int) -> dict:
         """Get a specific quiz."""
@@ -1,33 +1,64 @@
 """Canvas CLI - Command line interface for Canvas LMS."""
 
+import functools
+import os
 import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import click
+import requests
 import yaml
 
-from .api import CanvasAPI
-from .config import load_config, get_courses_dir, get_course_folder, save_config
+from .api import CanvasAPI, install_dns_cache, iter_discussion_entries
+from .config import YamlDumper, YamlLoader, load_config, get_courses_dir, get_course_folder, save_config
 from .converters import html_to_markdown, markdown_to_html
 
 
 def get_api() -> CanvasAPI:
     """Get configured Canvas API instance."""
     config = load_config()
-    return CanvasAPI(config["canvas_url"], config["api_token"])
+    etag_cache_dir = config.get("etag_cache_dir")
+    if etag_cache_dir:
+        # Relative paths are resolved against the folder holding the config
+        etag_cache_dir = config["_config_dir"] / Path(etag_cache_dir).expanduser()
+    install_dns_cache(config["canvas_url"])
+    return CanvasAPI(config["canvas_url"], config["api_token"], etag_cache_dir=etag_cache_dir)
+
+
+# Characters that are unsafe in filenames, deleted in one translate() pass
+_SLUG_UNSAFE = str.maketrans('', '', '<>:"/\\|?*')
+_SLUG_SEPARATORS = re.compile(r'[\s-]+')
 
 
 def slugify(text: str) -> str:
     """Convert text to a safe filename."""
-    # Remove or replace problematic characters
-    text = re.sub(r'[<>:"/\\|?*]', '', text)
-    text = re.sub(r'\s+', '-', text.strip())
-    text = re.sub(r'-+', '-', text)
+    # Remove problematic characters, then collapse whitespace/dash runs to one dash
+    text = text.translate(_SLUG_UNSAFE).strip()
+    text = _SLUG_SEPARATORS.sub('-', text)
     return text[:100]  # Limit length
 
 
+@functools.lru_cache(maxsize=512)
+def _name_pattern(search_lower: str) -> re.Pattern:
+    """Compile the word-boundary pattern used by matches_name for a search term."""
+    # Escape special regex characters in search term, but keep it as literal
+    escaped = re.escape(search_lower)
+
+    # Match at word boundaries (start/end of string, or next to a character that is
+    # neither a word character nor ".") so cases like "1.5" work, or else at a plain
+    # \b word boundary. One alternation lets a single search cover both. The
+    # boundary characters are consumed rather than looked around, which keeps the
+    # pattern free of backtracking-only constructs.
+    return re.compile(
+        r'(?:^|[^\w.])' + escaped + r'(?:$|[^\w.])'
+        r'|\b' + escaped + r'\b'
+    )
+
+
 def matches_name(search: str, target: str) -> bool:
     """Check if search term matches target with word boundary awareness.
 
@@ -36,32 +67,64 @@ def matches_name(search: str, target: str) -> bool:
     """
     search_lower = search.lower().strip()
     target_lower = target.lower()
+    # Any match needs the literal substring, so skip the regex when it is absent
+    if search_lower not in target_lower:
+        return False
+    return bool(_name_pattern(search_lower).search(target_lower))
 
-    # Escape special regex characters in search term, but keep it as literal
-    escaped = re.escape(search_lower)
-
-    # Match at word boundaries (start/end of string, spaces, or before/after non-alphanumeric)
-    # Use word boundary \b for letters/numbers, but also handle cases like "1.5"
-    pattern = r'(?:^|(?<=\s)|(?<=[^\w.]))' + escaped + r'(?:$|(?=\s)|(?=[^\w.]))'
-
-    if re.search(pattern, target_lower):
-        return True
 
-    # Also try simpler word boundary match
-    pattern_simple = r'\b' + escaped + r'\b'
-    if re.search(pattern_simple, target_lower):
-        return True
+def match_assignments(search_names, assignments: list) -> dict:
+    """Map each search name to the first assignment it matches (per matches_name).
 
-    return False
+    Assignments are scanned once, with each title lowercased a single time and
+    checked only against the names that are still unresolved.
+    """
+    pending = {}
+    for search in search_names:
+        search_lower = search.lower().strip()
+        pending.setdefault(search_lower, []).append(search)
+
+    matched = {}
+    for assignment in assignments:
+        if not pending:
+            break
+        target_lower = assignment.get("name", "").lower()
+        for search_lower in [s for s in pending if s in target_lower]:
+            if _name_pattern(search_lower).search(target_lower):
+                for search in pending.pop(search_lower):
+                    matched[search] = assignment
+    return matched
+
+
+@functools.lru_cache(maxsize=1)
+def _course_index(api: CanvasAPI) -> tuple:
+    """(name_lower, code_lower, course) for every course, fetched once per API client."""
+    return tuple(
+        (course.get("name", "").lower(), course.get("course_code", "").lower(), course)
+        for course in api.get_courses()
+    )
+
+
+_topics_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=32)
+def _topics_by_assignment(api: CanvasAPI, course_id: int) -> dict:
+    """assignment_id -> discussion topic id for a course, fetched once per API client."""
+    return {
+        topic["assignment_id"]: topic["id"]
+        for topic in api.get_discussion_topics(course_id)
+        if topic.get("assignment_id")
+    }
 
 
 def find_course_by_name(api: CanvasAPI, name: str) -> Optional[dict]:
     """Find a course by partial name match. Prompts if multiple matches found."""
     name_lower = name.lower()
-    matches = []
-    for course in api.get_courses():
-        if name_lower in course.get("name", "").lower() or name_lower in course.get("course_code", "").lower():
-            matches.append(course)
+    matches = [
+        course for course_name, course_code, course in _course_index(api)
+        if name_lower in course_name or name_lower in course_code
+    ]
 
     if not matches:
         return None
@@ -89,10 +152,11 @@ def find_course_by_name(api: CanvasAPI, name: str) -> Optional[dict]:
 def find_module_by_name(api: CanvasAPI, course_id: int, name: str) -> Optional[dict]:
     """Find a module by partial name match."""
     name_lower = name.lower()
-    for module in api.get_modules(course_id):
-        if name_lower in module.get("name", "").lower():
-            return module
-    return None
+    # Modules are streamed page by page, so a match stops further listing requests
+    return next(
+        (module for module in api.get_modules(course_id) if name_lower in module.get("name", "").lower()),
+        None,
+    )
 
 
 @click.group()
@@ -239,16 +303,17 @@ def attach_rubric(course: str, rubric_name: str, assignment_names: tuple, no_gra
         rubric_id = int(rubric_name)
         rubric_title = rubric_name
     except ValueError:
-        # Search by name
-        rubric_id = None
-        for rubric in api.get_rubrics(course_id):
-            if rubric_name.lower() in rubric.get("title", "").lower():
-                rubric_id = rubric["id"]
-                rubric_title = rubric.get("title", rubric_name)
-                break
-        if not rubric_id:
+        # Search by name, stopping the listing at the first match
+        rubric_lower = rubric_name.lower()
+        rubric = next(
+            (r for r in api.get_rubrics(course_id) if rubric_lower in r.get("title", "").lower()),
+            None,
+        )
+        if not rubric:
             click.echo(f"Rubric not found: {rubric_name}", err=True)
             sys.exit(1)
+        rubric_id = rubric["id"]
+        rubric_title = rubric.get("title", rubric_name)
 
     click.echo(f"Rubric: {rubric_title} (ID: {rubric_id})")
     click.echo(f"Use for grading: {not no_grading}\n")
@@ -257,14 +322,10 @@ def attach_rubric(course: str, rubric_name: str, assignment_names: tuple, no_gra
     assignments = list(api.get_assignments(course_id))
 
     # Match and attach to each assignment
+    matches = match_assignments(assignment_names, assignments)
     attached_count = 0
     for search_name in assignment_names:
-        # Find matching assignment
-        matched = None
-        for assignment in assignments:
-            if matches_name(search_name, assignment.get("name", "")):
-                matched = assignment
-                break
+        matched = matches.get(search_name)
 
         if not matched:
             click.echo(f"  Assignment not found: {search_name}", err=True)
@@ -292,10 +353,93 @@ def attach_rubric(course: str, rubric_name: str, assignment_names: tuple, no_gra
 
 # ==================== Pull Commands ====================
 
+# Directories already created by this process, so repeated saves skip the mkdir syscalls
+_created_dirs: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create path (and parents) once per process."""
+    if path not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(path)
+
+
+# Strings that yaml.dump emits unquoted on a single line
+_PLAIN_YAML_STRING = re.compile(r'[A-Za-z_][A-Za-z0-9_.-]*(?: [A-Za-z0-9_.-]+)*')
+_YAML_KEYWORDS = frozenset({"true", "false", "yes", "no", "on", "off", "null"})
+
+
+def _frontmatter_line(key: str, value) -> str:
+    """Render one frontmatter key exactly as yaml.dump would."""
+    if value is None:
+        return f"{key}: null"
+    if isinstance(value, bool):
+        return f"{key}: {'true' if value else 'false'}"
+    if type(value) is int:
+        return f"{key}: {value}"
+    if (isinstance(value, str) and len(key) + len(value) < 78
+            and value.lower() not in _YAML_KEYWORDS and _PLAIN_YAML_STRING.fullmatch(value)):
+        return f"{key}: {value}"
+    # Floats, lists, and strings needing quotes or folding go through PyYAML's
+    # pure-Python dumper: libyaml folds long quoted scalars differently
+    return yaml.dump({key: value}, Dumper=yaml.SafeDumper, default_flow_style=False).rstrip("\n")
+
+
+def _dump_frontmatter(frontmatter: dict) -> str:
+    """Equivalent to yaml.dump(frontmatter, default_flow_style=False).strip() for flat dicts."""
+    return "\n".join(_frontmatter_line(key, value) for key, value in sorted(frontmatter.items()))
+
+
+def _write_if_changed(path: Path, content: str) -> None:
+    """Write content to path unless the file already holds exactly that text."""
+    try:
+        if path.read_text() == content:
+            return
+    except (OSError, UnicodeDecodeError):
+        pass
+    path.write_text(content)
+
+
+_PULL_INDEX_FILE = "_pull_index.yaml"
+
+
+def _load_pull_index(course_dir: Path) -> dict:
+    """Load the record of what a previous full pull saved for this course."""
+    try:
+        index = yaml.load((course_dir / _PULL_INDEX_FILE).read_text(), Loader=YamlLoader)
+    except (OSError, yaml.YAMLError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _save_pull_index(course_dir: Path, index: dict) -> None:
+    """Save the pull index alongside _course.yaml."""
+    _write_if_changed(course_dir / _PULL_INDEX_FILE, yaml.dump(index, Dumper=YamlDumper, default_flow_style=False))
+
+
+def _index_entry(course_dir: Path, filepath: Path, updated_at: Optional[str]) -> dict:
+    """Describe a saved file so a later pull can tell whether it is still current."""
+    return {
+        "updated_at": updated_at,
+        "file": filepath.relative_to(course_dir).as_posix(),
+        "mtime_ns": filepath.stat().st_mtime_ns,
+    }
+
+
+def _is_current(course_dir: Path, entry: Optional[dict], updated_at: Optional[str]) -> bool:
+    """True when Canvas reports no change since the entry was saved and the local file is untouched."""
+    if not entry or not updated_at or entry.get("updated_at") != updated_at:
+        return False
+    try:
+        return (course_dir / entry["file"]).stat().st_mtime_ns == entry.get("mtime_ns")
+    except (OSError, KeyError, TypeError):
+        return False
+
+
 def save_page(course_dir: Path, page: dict, subdir: str = "pages") -> Path:
     """Save a page as markdown."""
     pages_dir = course_dir / subdir
-    pages_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(pages_dir)
 
     filename = slugify(page.get("title", page["url"])) + ".md"
     filepath = pages_dir / filename
@@ -313,20 +457,20 @@ def save_page(course_dir: Path, page: dict, subdir: str = "pages") -> Path:
     }
 
     content = f"""---
-{yaml.dump(frontmatter, default_flow_style=False).strip()}
+{_dump_frontmatter(frontmatter)}
 ---
 
 {body_md}
 """
 
-    filepath.write_text(content)
+    _write_if_changed(filepath, content)
     return filepath
 
 
 def save_assignment(course_dir: Path, assignment: dict, subdir: str = "assignments") -> Path:
     """Save an assignment as markdown."""
     assignments_dir = course_dir / subdir
-    assignments_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(assignments_dir)
 
     filename = slugify(assignment.get("name", str(assignment["id"]))) + ".md"
     filepath = assignments_dir / filename
@@ -349,20 +493,20 @@ def save_assignment(course_dir: Path, assignment: dict, subdir: str = "assignmen
     frontmatter = {k: v for k, v in frontmatter.items() if v is not None}
 
     content = f"""---
-{yaml.dump(frontmatter, default_flow_style=False).strip()}
+{_dump_frontmatter(frontmatter)}
 ---
 
 {desc_md}
 """
 
-    filepath.write_text(content)
+    _write_if_changed(filepath, content)
     return filepath
 
 
 def save_rubric(course_dir: Path, rubric: dict) -> Path:
     """Save a rubric as YAML."""
     rubrics_dir = course_dir / "rubrics"
-    rubrics_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(rubrics_dir)
 
     filename = slugify(rubric.get("title", str(rubric["id"]))) + ".yaml"
     filepath = rubrics_dir / filename
@@ -392,7 +536,9 @@ def save_rubric(course_dir: Path, rubric: dict) -> Path:
             })
         rubric_data["criteria"].append(crit_data)
 
-    filepath.write_text(yaml.dump(rubric_data, default_flow_style=False, allow_unicode=True))
+    # Pure-Python dumper: libyaml escapes characters outside the BMP (emoji) even
+    # with allow_unicode, and rubric files are meant to be edited by hand
+    _write_if_changed(filepath, yaml.dump(rubric_data, Dumper=yaml.SafeDumper, default_flow_style=False, allow_unicode=True))
     return filepath
 
 
@@ -441,7 +587,7 @@ def push_rubric_file(api: CanvasAPI, filepath: Path, dry_run: bool = False) -> b
     with the returned canvas_id. Otherwise, updates the existing rubric.
     """
     try:
-        rubric_data = yaml.safe_load(filepath.read_text())
+        rubric_data = yaml.load(filepath.read_text(), Loader=YamlLoader)
     except Exception as e:
         click.echo(f"  Error reading {filepath.name}: {e}", err=True)
         return False
@@ -470,7 +616,7 @@ def push_rubric_file(api: CanvasAPI, filepath: Path, dry_run: bool = False) -> b
             if new_id:
                 # Update local file with the new canvas_id
                 rubric_data["canvas_id"] = new_id
-                filepath.write_text(yaml.dump(rubric_data, default_flow_style=False, allow_unicode=True))
+                filepath.write_text(yaml.dump(rubric_data, Dumper=yaml.SafeDumper, default_flow_style=False, allow_unicode=True))
                 click.echo(f"    Created with ID: {new_id}")
             else:
                 click.echo(f"    Warning: Could not get ID from response", err=True)
@@ -481,12 +627,53 @@ def push_rubric_file(api: CanvasAPI, filepath: Path, dry_run: bool = False) -> b
     return True
 
 
-def save_discussion_entries(course_dir: Path, topic_name: str, topic_id: int, api: CanvasAPI, course_id: int) -> Path:
-    """Save discussion entries (posts and replies) as markdown."""
+# Flattens discussion entry HTML to plain text in one pass: paragraph ends and
+# line breaks become newlines, every other tag is dropped
+_ENTRY_HTML = re.compile(r'(?P<newline></p>|<br\s*/?>)|<[^>]+>')
+
+
+def _entry_tag_replacement(match: re.Match) -> str:
+    return '\n' if match.group('newline') else ''
+
+
+def _format_entry(output: list, participants: dict, entry: dict, indent: int) -> None:
+    """Append one discussion entry (not its replies) to output."""
+    prefix = "  " * indent
+    heading = "##" if indent == 0 else "###"
+
+    user_name = participants.get(entry.get('user_id'), 'Unknown')
+    posted = entry.get('created_at', 'Unknown date')
+    if posted != 'Unknown date':
+        posted = posted[:10]
+
+    output.append(f"{prefix}{heading} {user_name}")
+    output.append(f"{prefix}*Posted: {posted}*\n")
+
+    message = entry.get('message', '(No content)')
+    # Clean up HTML
+    message = _ENTRY_HTML.sub(_entry_tag_replacement, message)
+    message = message.strip()
+
+    # Indent message content for nested replies
+    if indent > 0:
+        message = '\n'.join(prefix + line for line in message.split('\n'))
+    output.append(f"{message}\n")
+
+    # Replies follow directly in the walk
+    if entry.get('replies', []):
+        output.append(f"{prefix}**Replies:**\n")
+
+
+def save_discussion_entries(course_dir: Path, topic_name: str, topic_id: int, api: CanvasAPI,
+                            course_id: int) -> tuple[Path, int]:
+    """Save discussion entries (posts and replies) as markdown.
+
+    Returns the saved path and the number of top-level posts.
+    """
     from datetime import datetime
 
     discussions_dir = course_dir / "discussions"
-    discussions_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(discussions_dir)
 
     filename = slugify(topic_name) + "-entries.md"
     filepath = discussions_dir / filename
@@ -501,58 +688,24 @@ def save_discussion_entries(course_dir: Path, topic_name: str, topic_id: int, ap
     output.append(f"# {topic_name} - Student Posts\n")
     output.append(f"*Pulled: {datetime.now().strftime('%Y-%m-%d %H:%M')}*\n")
 
-    def format_entry(entry, indent=0):
-        """Format a discussion entry with replies."""
-        lines = []
-        prefix = "  " * indent
-        heading = "##" if indent == 0 else "###"
-
-        user_name = participants.get(entry.get('user_id'), 'Unknown')
-        posted = entry.get('created_at', 'Unknown date')
-        if posted != 'Unknown date':
-            posted = posted[:10]
-
-        lines.append(f"{prefix}{heading} {user_name}")
-        lines.append(f"{prefix}*Posted: {posted}*\n")
-
-        message = entry.get('message', '(No content)')
-        # Clean up HTML
-        message = re.sub(r'<p>', '', message)
-        message = re.sub(r'</p>', '\n', message)
-        message = re.sub(r'<br\s*/?>', '\n', message)
-        message = re.sub(r'<[^>]+>', '', message)
-        message = message.strip()
-
-        # Indent message content for nested replies
-        if indent > 0:
-            message = '\n'.join(prefix + line for line in message.split('\n'))
-        lines.append(f"{message}\n")
-
-        # Handle replies
-        replies = entry.get('replies', [])
-        if replies:
-            lines.append(f"{prefix}**Replies:**\n")
-            for reply in replies:
-                lines.extend(format_entry(reply, indent + 1))
-
-        return lines
-
+    # Pre-order walk; a separator closes each top-level post with its replies
     entries = data.get('view', [])
-    for entry in entries:
-        output.extend(format_entry(entry))
+    for position, (entry, depth) in enumerate(iter_discussion_entries(data)):
+        if depth == 0 and position:
+            output.append("---\n")
+        _format_entry(output, participants, entry, depth)
+    if entries:
         output.append("---\n")
 
     filepath.write_text('\n'.join(output))
-    return filepath
+    return filepath, len(entries)
 
 
 def save_submission(course_dir: Path, assignment_name: str, submission: dict,
                     user_info: dict, api: "CanvasAPI" = None) -> Optional[Path]:
     """Save a submission as markdown and download any attachments."""
-    import requests
-
     submissions_dir = course_dir / "submissions" / slugify(assignment_name)
-    submissions_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(submissions_dir)
 
     # Get user name
     user_name = user_info.get("name", f"user-{submission.get('user_id')}")
@@ -569,7 +722,7 @@ def save_submission(course_dir: Path, assignment_name: str, submission: dict,
 
     # Download attachments
     attachments = submission.get("attachments", [])
-    attachment_files = []
+    downloads = []
     for i, attachment in enumerate(attachments):
         url = attachment.get("url")
         original_filename = attachment.get("filename", f"attachment-{i+1}")
@@ -581,27 +734,43 @@ def save_submission(course_dir: Path, assignment_name: str, submission: dict,
         else:
             att_filename = f"{user_slug}-{i+1}{ext}"
 
-        att_filepath = submissions_dir / att_filename
-
         if url:
+            downloads.append((url, submissions_dir / att_filename, original_filename))
+
+    def download(url: str, att_filepath: Path) -> None:
+        # Stream to disk so large uploads never sit in memory whole
+        getter = api.session.get if api else requests.get
+        with getter(url, timeout=30, stream=True) as resp:
+            resp.raise_for_status()
+            try:
+                with open(att_filepath, "wb") as f:
+                    for chunk in resp.iter_content(chunk_size=65536):
+                        f.write(chunk)
+            except Exception:
+                att_filepath.unlink(missing_ok=True)
+                raise
+
+    # Fetch concurrently; report results in attachment order
+    attachment_files = []
+    if downloads:
+        workers = min(len(downloads), api.max_workers if api else 8)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(download, url, path) for url, path, _ in downloads]
+        for future, (_, att_filepath, original_filename) in zip(futures, downloads):
             try:
-                if api:
-                    resp = api.session.get(url, timeout=30)
-                else:
-                    resp = requests.get(url, timeout=30)
-                resp.raise_for_status()
-                att_filepath.write_bytes(resp.content)
-                attachment_files.append(att_filename)
+                future.result()
+                attachment_files.append(att_filepath.name)
             except Exception as e:
                 click.echo(f"      Warning: Failed to download {original_filename}: {e}")
 
     # Get comments
-    comments_md = ""
+    comment_parts = []
     for comment in submission.get("submission_comments", []):
         author = comment.get("author_name", "Unknown")
         date = comment.get("created_at", "")[:10] if comment.get("created_at") else ""
         text = comment.get("comment", "")
-        comments_md += f"\n### {author} ({date})\n{text}\n"
+        comment_parts.append(f"\n### {author} ({date})\n{text}\n")
+    comments_md = "".join(comment_parts)
 
     # Create frontmatter
     frontmatter = {
@@ -621,12 +790,12 @@ def save_submission(course_dir: Path, assignment_name: str, submission: dict,
     # Build attachments section for markdown
     attachments_md = ""
     if attachment_files:
-        attachments_md = "\n## Attachments\n"
-        for att_file in attachment_files:
-            attachments_md += f"- [{att_file}]({att_file})\n"
+        attachments_md = "\n## Attachments\n" + "".join(
+            f"- [{att_file}]({att_file})\n" for att_file in attachment_files
+        )
 
     content = f"""---
-{yaml.dump(frontmatter, default_flow_style=False).strip()}
+{_dump_frontmatter(frontmatter)}
 ---
 
 # Submission
@@ -637,7 +806,7 @@ def save_submission(course_dir: Path, assignment_name: str, submission: dict,
 {comments_md if comments_md else "(No comments)"}
 """
 
-    filepath.write_text(content)
+    _write_if_changed(filepath, content)
     return filepath
 
 
@@ -652,9 +821,11 @@ def save_submission(course_dir: Path, assignment_name: str, submission: dict,
               help="Include submissions")
 @click.option("--discussions/--no-discussions", "include_discussions", default=False,
               help="Include discussion posts/replies when pulling assignments")
+@click.option("--workers", type=click.IntRange(1, 32), default=None,
+              help="Concurrent requests when fetching pages (default 8)")
 def pull(course: str, module_name: Optional[str], page_name: Optional[str],
          assignment_name: Optional[str], discussion_name: Optional[str],
-         rubrics: bool, submissions: str, include_discussions: bool):
+         rubrics: bool, submissions: str, include_discussions: bool, workers: Optional[int]):
     """Pull content from Canvas to local files."""
     api = get_api()
 
@@ -684,7 +855,7 @@ def pull(course: str, module_name: Optional[str], page_name: Optional[str],
         "name": course_name,
         "code": course_data.get("course_code"),
     }
-    (course_dir / "_course.yaml").write_text(yaml.dump(course_meta, default_flow_style=False))
+    (course_dir / "_course.yaml").write_text(yaml.dump(course_meta, Dumper=YamlDumper, default_flow_style=False))
 
     pulled_count = 0
 
@@ -717,10 +888,9 @@ def pull(course: str, module_name: Optional[str], page_name: Optional[str],
 
                 # Pull discussion entries (posts and replies)
                 click.echo(f"  Pulling discussion posts...")
-                entries_path = save_discussion_entries(
+                entries_path, entry_count = save_discussion_entries(
                     course_dir, topic["title"], topic["id"], api, course_id
                 )
-                entry_count = len(api.get_discussion_entries(course_id, topic["id"]).get("view", []))
                 click.echo(f"    {entry_count} posts saved to: {entries_path.name}")
                 pulled_count += 1
 
@@ -745,10 +915,9 @@ def pull(course: str, module_name: Optional[str], page_name: Optional[str],
                     for topic in api.get_discussion_topics(course_id):
                         if topic.get("assignment_id") == assignment["id"]:
                             click.echo(f"  Pulling discussion posts...")
-                            entries_path = save_discussion_entries(
+                            entries_path, entry_count = save_discussion_entries(
                                 course_dir, assignment["name"], topic["id"], api, course_id
                             )
-                            entry_count = len(api.get_discussion_entries(course_id, topic["id"]).get("view", []))
                             click.echo(f"    {entry_count} posts saved to: {entries_path.name}")
                             break
 
@@ -787,27 +956,31 @@ def pull(course: str, module_name: Optional[str], page_name: Optional[str],
             "require_sequential_progress": module_data.get("require_sequential_progress"),
             "published": module_data.get("published"),
         }
-        (module_dir / "_module.yaml").write_text(yaml.dump(module_meta, default_flow_style=False))
+        (module_dir / "_module.yaml").write_text(yaml.dump(module_meta, Dumper=YamlDumper, default_flow_style=False))
 
         click.echo(f"  Pulling module: {module_data['name']}")
 
-        for item in api.get_module_items(course_id, module_data["id"]):
+        # Fetch item contents concurrently, then save in module order
+        module_items = list(api.get_module_items(course_id, module_data["id"]))
+        contents = api.get_module_item_contents(course_id, module_items)
+
+        for item, content in zip(module_items, contents):
             item_type = item.get("type")
 
             if item_type == "Page":
-                page = api.get_page(course_id, item["page_url"])
+                page = content
                 filepath = save_page(course_dir, page, subdir=module_dir.name)
                 click.echo(f"    Page: {filepath.name}")
                 pulled_count += 1
 
             elif item_type == "Assignment":
-                assignment = api.get_assignment(course_id, item["content_id"])
+                assignment = content
                 filepath = save_assignment(course_dir, assignment, subdir=module_dir.name)
                 click.echo(f"    Assignment: {filepath.name}")
                 pulled_count += 1
 
             elif item_type == "Discussion":
-                topic = api.get_discussion_topic(course_id, item["content_id"])
+                topic = content
                 # Save discussion as a page-like markdown
                 disc_data = {
                     "page_id": topic["id"],
@@ -824,12 +997,26 @@ def pull(course: str, module_name: Optional[str], page_name: Optional[str],
         return
 
     # Pull entire course
+    # Pages whose updated_at and local file match the last pull are not re-fetched;
+    # the rest are fetched concurrently and saved in listing order
+    pull_index = _load_pull_index(course_dir)
     click.echo("  Pulling all pages...")
-    for page in api.get_pages(course_id):
-        full_page = api.get_page(course_id, page["url"])
-        save_page(course_dir, full_page)
-        pulled_count += 1
-    click.echo(f"    {pulled_count} pages")
+    pages = list(api.get_pages(course_id))
+    stale = [
+        page for page in pages
+        if not _is_current(course_dir, pull_index.get(f"page:{page['url']}"), page.get("updated_at"))
+    ]
+    full_pages = api.parallel_map(lambda page: api.get_page(course_id, page["url"]), stale, workers=workers)
+    for page, full_page in zip(stale, full_pages):
+        filepath = save_page(course_dir, full_page)
+        pull_index[f"page:{page['url']}"] = _index_entry(course_dir, filepath, full_page.get("updated_at"))
+    _save_pull_index(course_dir, pull_index)
+    pulled_count += len(pages)
+    unchanged_count = len(pages) - len(stale)
+    if unchanged_count:
+        click.echo(f"    {pulled_count} pages ({unchanged_count} unchanged)")
+    else:
+        click.echo(f"    {pulled_count} pages")
 
     assignment_count = 0
     click.echo("  Pulling all assignments...")
@@ -853,63 +1040,96 @@ def pull(course: str, module_name: Optional[str], page_name: Optional[str],
 
 # ==================== Push Commands ====================
 
+# Opening and closing "---" lines, with the YAML between them (absent when empty)
+_FRONTMATTER = re.compile(r'---[ \t]*\n(?:(.*?)\n)?---[ \t]*(?:\n|\Z)', re.DOTALL)
+
+
 def parse_markdown_file(filepath: Path) -> tuple[dict, str]:
     """Parse a markdown file with YAML frontmatter."""
     content = filepath.read_text()
 
     # Extract frontmatter
-    if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            frontmatter = yaml.safe_load(parts[1]) or {}
-            if not isinstance(frontmatter, dict):
-                frontmatter = {}
-            body = parts[2].strip()
-            return frontmatter, body
+    match = _FRONTMATTER.match(content)
+    if not match:
+        return {}, content
 
-    return {}, content
+    frontmatter = yaml.load(match.group(1) or "", Loader=YamlLoader) or {}
+    if not isinstance(frontmatter, dict):
+        frontmatter = {}
+    return frontmatter, content[match.end():].strip()
 
 
-def find_course_meta(filepath: Path) -> dict:
-    """Find _course.yaml from a content file path."""
-    # Try parent.parent first (for files in subdirectories)
-    course_meta_path = filepath.parent.parent / "_course.yaml"
+@functools.lru_cache(maxsize=128)
+def _find_course_meta_cached(directory: Path) -> Optional[tuple]:
+    """Locate and parse the _course.yaml governing files in directory.
+
+    Returns (path, parsed contents), with contents None when the YAML is
+    malformed, or None when there is no _course.yaml at all.
+    """
+    # Try the directory's parent first (for files in subdirectories)
+    course_meta_path = directory.parent / "_course.yaml"
     if not course_meta_path.exists():
-        # Try parent (for files directly in course folder)
-        course_meta_path = filepath.parent / "_course.yaml"
+        # Try the directory itself (for files directly in course folder)
+        course_meta_path = directory / "_course.yaml"
     if not course_meta_path.exists():
         # Try going up further (for deeply nested files)
-        for parent in filepath.parents:
+        for parent in (directory, *directory.parents):
             candidate = parent / "_course.yaml"
             if candidate.exists():
                 course_meta_path = candidate
                 break
 
     if not course_meta_path.exists():
+        return None
+
+    try:
+        return course_meta_path, yaml.load(course_meta_path.read_text(), Loader=YamlLoader)
+    except yaml.YAMLError:
+        return course_meta_path, None
+
+
+def find_course_meta(filepath: Path) -> dict:
+    """Find _course.yaml from a content file path.
+
+    The lookup and parse are cached per directory, so pushing many files from
+    one module reads the course metadata once. Raises FileNotFoundError when
+    there is no _course.yaml, or when it is not a mapping with a canvas_id.
+    """
+    found = _find_course_meta_cached(filepath.parent)
+    if found is None:
         raise FileNotFoundError(
             f"Cannot find _course.yaml for {filepath}. Pull the course first to create local metadata."
         )
+    course_meta_path, meta = found
+    if not isinstance(meta, dict) or "canvas_id" not in meta:
+        raise FileNotFoundError(
+            f"{course_meta_path} has no canvas_id. Pull the course again to recreate local metadata."
+        )
+    return dict(meta)
 
-    return yaml.safe_load(course_meta_path.read_text())
 
+def push_file(api: CanvasAPI, filepath: Path, dry_run: bool = False, echo=click.echo) -> Optional[bool]:
+    """Push a single file to Canvas.
 
-def push_file(api: CanvasAPI, filepath: Path, dry_run: bool = False) -> bool:
-    """Push a single file to Canvas. Returns True if successful."""
+    Returns True if successful, False on an error, and None when the file is
+    skipped as not pushable (no canvas_id, unknown content type). Progress
+    and errors are reported through echo (click.echo signature).
+    """
     frontmatter, body = parse_markdown_file(filepath)
 
     if "canvas_id" not in frontmatter:
-        click.echo(f"  Skipping {filepath.name}: no canvas_id in frontmatter", err=True)
-        return False
+        echo(f"  Skipping {filepath.name}: no canvas_id in frontmatter", err=True)
+        return None
 
     try:
         course_meta = find_course_meta(filepath)
         course_id = course_meta["canvas_id"]
     except FileNotFoundError as e:
-        click.echo(f"  Error: {e}", err=True)
+        echo(f"  Error: {e}", err=True)
         return False
 
-    # Convert markdown back to HTML
-    body_html = markdown_to_html(body)
+    # Convert markdown back to HTML (a dry run only reports, so skip the work)
+    body_html = None if dry_run else markdown_to_html(body)
 
     # Determine if it's a page, discussion, or assignment based on frontmatter
     submission_types = frontmatter.get("submission_types", [])
@@ -917,12 +1137,12 @@ def push_file(api: CanvasAPI, filepath: Path, dry_run: bool = False) -> bool:
 
     if "canvas_url" in frontmatter:
         # It's a page
-        click.echo(f"  Page: {frontmatter.get('title', filepath.name)}")
+        echo(f"  Page: {frontmatter.get('title', filepath.name)}")
         if not dry_run:
             api.update_page(course_id, frontmatter["canvas_url"], body=body_html)
     elif is_discussion:
         # It's a discussion topic - need to find topic_id from assignment_id
-        click.echo(f"  Discussion: {frontmatter.get('title', filepath.name)}")
+        echo(f"  Discussion: {frontmatter.get('title', filepath.name)}")
 
         # Look up the discussion topic ID from assignment ID
         assignment_id = frontmatter["canvas_id"]
@@ -932,14 +1152,12 @@ def push_file(api: CanvasAPI, filepath: Path, dry_run: bool = False) -> bool:
         if "discussion_topic_id" in frontmatter:
             topic_id = frontmatter["discussion_topic_id"]
         else:
-            # Find the topic by matching assignment_id
-            for topic in api.get_discussion_topics(course_id):
-                if topic.get("assignment_id") == assignment_id:
-                    topic_id = topic["id"]
-                    break
+            # Find the topic by matching assignment_id (module pushes share one listing)
+            with _topics_lock:
+                topic_id = _topics_by_assignment(api, course_id).get(assignment_id)
 
         if not topic_id:
-            click.echo(f"  Error: Could not find discussion topic for assignment {assignment_id}", err=True)
+            echo(f"  Error: Could not find discussion topic for assignment {assignment_id}", err=True)
             return False
 
         update_data = {"message": body_html}
@@ -949,7 +1167,7 @@ def push_file(api: CanvasAPI, filepath: Path, dry_run: bool = False) -> bool:
             api.update_discussion_topic(course_id, topic_id, **update_data)
     elif "submission_types" in frontmatter or "points_possible" in frontmatter:
         # It's an assignment
-        click.echo(f"  Assignment: {frontmatter.get('title', filepath.name)}")
+        echo(f"  Assignment: {frontmatter.get('title', filepath.name)}")
         update_data = {"description": body_html}
         if "due_at" in frontmatter:
             update_data["due_at"] = frontmatter["due_at"]
@@ -959,12 +1177,30 @@ def push_file(api: CanvasAPI, filepath: Path, dry_run: bool = False) -> bool:
             api.update_assignment(course_id, frontmatter["canvas_id"], **update_data)
     else:
         # Assume it's a page if it has canvas_url, otherwise try as generic content
-        click.echo(f"  Unknown type: {filepath.name} - skipping", err=True)
-        return False
+        echo(f"  Unknown type: {filepath.name} - skipping", err=True)
+        return None
 
     return True
 
 
+def find_module_dir(courses_dir: Path, module_name: str) -> Optional[Path]:
+    """Find the first <course>/<module> directory whose name contains module_name.
+
+    Names are compared before anything is stat'ed, so only candidates that
+    match cost a directory check.
+    """
+    name_lower = module_name.lower()
+    with os.scandir(courses_dir) as courses:
+        for course in courses:
+            if not course.is_dir():
+                continue
+            with os.scandir(course.path) as items:
+                for item in items:
+                    if name_lower in item.name.lower() and item.is_dir():
+                        return Path(item.path)
+    return None
+
+
 @cli.command()
 @click.option("-m", "--module", "module_name", help="Push specific module by name")
 @click.option("-f", "--file", "file_path", type=click.Path(exists=True), help="Push specific file (auto-detects type)")
@@ -973,9 +1209,13 @@ def push(module_name: Optional[str], file_path: Optional[str], dry_run: bool):
     """Push local changes to Canvas."""
     api = get_api()
     courses_dir = get_courses_dir()
+    _topics_by_assignment.cache_clear()
 
     if dry_run:
         click.echo("[DRY RUN] No changes will be made.\n")
+    else:
+        # Connect while local files are parsed and converted
+        api.warm_up()
 
     # Push specific file
     if file_path:
@@ -994,24 +1234,47 @@ def push(module_name: Optional[str], file_path: Optional[str], dry_run: bool):
 
     # Push module
     if module_name:
-        # Find the module directory
-        for course_path in courses_dir.iterdir():
-            if not course_path.is_dir():
-                continue
+        item_path = find_module_dir(courses_dir, module_name)
+        if item_path is None:
+            click.echo(f"Module directory not found: {module_name}", err=True)
+            sys.exit(1)
 
-            for item_path in course_path.iterdir():
-                if item_path.is_dir() and module_name.lower() in item_path.name.lower():
-                    click.echo(f"Pushing module: {item_path.name}")
+        click.echo(f"Pushing module: {item_path.name}")
 
-                    # Push all markdown files in the module
-                    for md_file in item_path.glob("*.md"):
-                        push_file(api, md_file, dry_run)
+        def push_buffered(md_file: Path) -> tuple[list, Optional[bool]]:
+            """Push one file, returning its (message, err) pairs and push_file's result."""
+            messages = []
 
-                    click.echo("\nDone!" if not dry_run else "\n[DRY RUN] Would push above items.")
-                    return
+            def echo(message, err=False):
+                messages.append((message, err))
 
-        click.echo(f"Module directory not found: {module_name}", err=True)
-        sys.exit(1)
+            # One bad file (malformed frontmatter, failed request) must not
+            # discard the output of files already pushed
+            try:
+                ok = push_file(api, md_file, dry_run, echo=echo)
+            except Exception as e:
+                echo(f"  Error pushing {md_file.name}: {e}", err=True)
+                return messages, False
+            return messages, ok
+
+        # Push all markdown files in the module concurrently; each file's
+        # messages are buffered and echoed in file order
+        failed = skipped = 0
+        for messages, ok in api.parallel_map(push_buffered, item_path.glob("*.md")):
+            for message, err in messages:
+                click.echo(message, err=err)
+            if ok is None:
+                skipped += 1
+            elif not ok:
+                failed += 1
+
+        if skipped:
+            click.echo(f"\n{skipped} file(s) skipped.")
+        if failed:
+            click.echo(f"\n{failed} file(s) failed to push.", err=True)
+            sys.exit(1)
+        click.echo("\nDone!" if not dry_run else "\n[DRY RUN] Would push above items.")
+        return
 
     click.echo("Please specify what to push: --file or --module")
     sys.exit(1)
@@ -1019,6 +1282,36 @@ def push(module_name: Optional[str], file_path: Optional[str], dry_run: bool):
 
 # ==================== Status Command ====================
 
+def _count_course_files(course_path: Path) -> tuple[int, int, int]:
+    """Count (markdown, rubric, submission) files under a course in a single walk.
+
+    Same tallies as globbing "**/*.md", "rubrics/*.yaml" and
+    "submissions/**/*.md": markdown includes submissions, and only rubric
+    files directly inside rubrics/ count. Symlinked directories are not
+    followed.
+    """
+    pages = rubrics = submissions = 0
+    # (directory, top-level folder it sits under, depth below course_path)
+    stack = [(course_path, None, 0)]
+    while stack:
+        directory, top, depth = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, entry.name if depth == 0 else top, depth + 1))
+                elif entry.name.endswith(".md"):
+                    pages += 1
+                    if top == "submissions":
+                        submissions += 1
+                elif top == "rubrics" and depth == 1 and entry.name.endswith(".yaml"):
+                    rubrics += 1
+    return pages, rubrics, submissions
+
+
 @cli.command()
 def status():
     """Show sync status of local files."""
@@ -1034,18 +1327,16 @@ def status():
 
         course_meta_path = course_path / "_course.yaml"
         if course_meta_path.exists():
-            meta = yaml.safe_load(course_meta_path.read_text())
+            meta = yaml.load(course_meta_path.read_text(), Loader=YamlLoader)
             click.echo(f"\n{meta.get('name', course_path.name)}")
             click.echo("-" * 40)
 
         # Count files
-        pages = list(course_path.glob("**/*.md"))
-        rubrics = list(course_path.glob("rubrics/*.yaml"))
-        submissions = list(course_path.glob("submissions/**/*.md"))
+        pages, rubrics, submissions = _count_course_files(course_path)
 
-        click.echo(f"  Pages/Assignments: {len(pages)}")
-        click.echo(f"  Rubrics: {len(rubrics)}")
-        click.echo(f"  Submissions: {len(submissions)}")
+        click.echo(f"  Pages/Assignments: {pages}")
+        click.echo(f"  Rubrics: {rubrics}")
+        click.echo(f"  Submissions: {submissions}")
 
 
 def main():
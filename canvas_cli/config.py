@@ -1,10 +1,19 @@
 """Configuration management for Canvas CLI."""
 
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import yaml
 
+# YAML loader and dumper used throughout the package: the libyaml C bindings
+# when PyYAML was built with them, otherwise the pure-Python safe classes
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
 
 def parse_course_info(course_name: str) -> dict:
     """Parse course name to extract semester and course code.
@@ -30,17 +39,37 @@ def get_default_folder(config: dict) -> str:
 
 def find_config_file() -> Optional[Path]:
     """Find .canvas-config.yaml by walking up from current directory."""
-    current = Path.cwd()
-    while current != current.parent:
-        config_path = current / ".canvas-config.yaml"
-        if config_path.exists():
-            return config_path
-        current = current.parent
+    # Plain string paths: one join and one stat per level
+    current = os.getcwd()
+    parent = os.path.dirname(current)
+    while current != parent:
+        config_path = os.path.join(current, ".canvas-config.yaml")
+        if os.path.exists(config_path):
+            return Path(config_path)
+        current, parent = parent, os.path.dirname(parent)
     return None
 
 
-def load_config() -> dict:
-    """Load configuration from .canvas-config.yaml."""
+def _folder_matcher(course_folders: dict) -> tuple:
+    """Compile course_folders into one pattern, returning (pattern, folders).
+
+    Group i of the pattern is the i-th longest prefix and maps to folders[i].
+    The pattern is a zero-width lookahead, so finditer reports a match at
+    every position where some prefix occurs; the lowest group number seen
+    is the longest matching prefix. pattern is None with no mappings.
+    """
+    # Prefer the longest prefix first so specific mappings win over broad ones.
+    prefixes = sorted(course_folders.items(), key=lambda item: len(item[0]), reverse=True)
+    if not prefixes:
+        return None, []
+    alternatives = "|".join(f"({re.escape(prefix.upper())})" for prefix, _ in prefixes)
+    pattern = re.compile(rf"(?=(?<![A-Z0-9])(?:{alternatives})(?![A-Z0-9]))")
+    return pattern, [folder for _, folder in prefixes]
+
+
+@lru_cache(maxsize=1)
+def _load_config_cached(cwd: str) -> dict:
+    """Find and parse the config for cwd; see load_config."""
     config_path = find_config_file()
     if not config_path:
         raise FileNotFoundError(
@@ -48,13 +77,26 @@ def load_config() -> dict:
         )
 
     with open(config_path) as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=YamlLoader)
 
     # Store the config directory for relative paths
     config["_config_dir"] = config_path.parent
+    config["_folder_matcher"] = _folder_matcher(config.get("course_folders") or {})
     return config
 
 
+def load_config() -> dict:
+    """Load configuration from .canvas-config.yaml.
+
+    The file is located and parsed once per working directory; callers get
+    their own shallow copy of the cached result.
+    """
+    return dict(_load_config_cached(str(Path.cwd())))
+
+
+load_config.cache_clear = _load_config_cached.cache_clear
+
+
 def get_courses_dir() -> Path:
     """Get the default courses directory path."""
     config = load_config()
@@ -71,21 +113,18 @@ def get_course_folder(course_code: str, course_name: str = "") -> Path:
     """
     config = load_config()
     config_dir = config["_config_dir"]
-    course_folders = config.get("course_folders", {})
     default_folder = get_default_folder(config)
 
     # Combine code and name for matching (e.g., "AI and Ethics: PHIL-123-001H" + course name)
     search_text = f"{course_code} {course_name}".upper()
 
-    # Try to match course code prefix anywhere in the text
+    # Try to match course code prefix anywhere in the text; the longest matching prefix wins
     target_folder = default_folder
-    # Prefer the longest prefix first so specific mappings win over broad ones.
-    for prefix, folder in sorted(course_folders.items(), key=lambda item: len(item[0]), reverse=True):
-        escaped = re.escape(prefix.upper())
-        pattern = rf"(^|[^A-Z0-9]){escaped}([^A-Z0-9]|$)"
-        if re.search(pattern, search_text):
-            target_folder = folder
-            break
+    pattern, folders = config["_folder_matcher"]
+    if pattern is not None:
+        best = min((match.lastindex - 1 for match in pattern.finditer(search_text)), default=None)
+        if best is not None:
+            target_folder = folders[best]
 
     # Parse course name to get semester and course code for folder name
     course_info = parse_course_info(course_name)
@@ -109,4 +148,5 @@ def save_config(config: dict, path: Optional[Path] = None) -> None:
     save_data = {k: v for k, v in config.items() if not k.startswith("_")}
 
     with open(path, "w") as f:
-        yaml.dump(save_data, f, default_flow_style=False)
+        yaml.dump(save_data, f, Dumper=YamlDumper, default_flow_style=False)
+    load_config.cache_clear()
@@ -4,6 +4,75 @@ import re
 from typing import Optional
 import html
 
+# html_to_markdown patterns
+_RE_TABLE = re.compile(r'<table[^>]*>.*?</table>', re.DOTALL | re.IGNORECASE)
+# One pass each: the closing tag must repeat the opening tag's name/level
+_RE_STYLE_SCRIPT = re.compile(r'<(style|script)[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE)
+_RE_HEADING = re.compile(r'<h([1-6])[^>]*>(.*?)</h\1>', re.DOTALL | re.IGNORECASE)
+_RE_STRONG = re.compile(r'<strong[^>]*>(.*?)</strong>', re.DOTALL | re.IGNORECASE)
+_RE_B = re.compile(r'<b[^>]*>(.*?)</b>', re.DOTALL | re.IGNORECASE)
+_RE_EM = re.compile(r'<em[^>]*>(.*?)</em>', re.DOTALL | re.IGNORECASE)
+_RE_I = re.compile(r'<i[^>]*>(.*?)</i>', re.DOTALL | re.IGNORECASE)
+_RE_A = re.compile(r'<a[^>]*href="([^"]*)"[^>]*>(.*?)</a>', re.DOTALL | re.IGNORECASE)
+_RE_IMG_ALT = re.compile(r'<img[^>]*src="([^"]*)"[^>]*alt="([^"]*)"[^>]*/?>', re.IGNORECASE)
+_RE_IMG = re.compile(r'<img[^>]*src="([^"]*)"[^>]*/?>', re.IGNORECASE)
+_RE_UL_OPEN = re.compile(r'<ul[^>]*>', re.IGNORECASE)
+_RE_UL_CLOSE = re.compile(r'</ul>', re.IGNORECASE)
+_RE_LI = re.compile(r'<li[^>]*>(.*?)</li>', re.DOTALL | re.IGNORECASE)
+_RE_OL_OPEN = re.compile(r'<ol[^>]*>', re.IGNORECASE)
+_RE_OL_CLOSE = re.compile(r'</ol>', re.IGNORECASE)
+_RE_BLOCKQUOTE = re.compile(r'<blockquote[^>]*>(.*?)</blockquote>', re.DOTALL | re.IGNORECASE)
+_RE_PRE_CODE = re.compile(r'<pre[^>]*><code[^>]*>(.*?)</code></pre>', re.DOTALL | re.IGNORECASE)
+_RE_CODE = re.compile(r'<code[^>]*>(.*?)</code>', re.DOTALL | re.IGNORECASE)
+_RE_HR = re.compile(r'<hr[^>]*/?>', re.IGNORECASE)
+_RE_P = re.compile(r'<p[^>]*>(.*?)</p>', re.DOTALL | re.IGNORECASE)
+_RE_BR = re.compile(r'<br[^>]*/?>', re.IGNORECASE)
+_RE_DIV = re.compile(r'<div[^>]*>(.*?)</div>', re.DOTALL | re.IGNORECASE)
+_RE_SPAN = re.compile(r'<span[^>]*>(.*?)</span>', re.DOTALL | re.IGNORECASE)
+_RE_TAG = re.compile(r'<[^>]+>')
+_RE_MULTI_NL = re.compile(r'\n{3,}')
+_RE_MULTI_SPACE = re.compile(r' +')
+
+# markdown_to_html patterns
+_RE_CODE_BLOCK = re.compile(r'```\n?(.*?)\n?```', re.DOTALL)
+_RE_INLINE_CODE = re.compile(r'`([^`]+)`')
+_RE_MD_H6 = re.compile(r'^###### (.+)$', re.MULTILINE)
+_RE_MD_H5 = re.compile(r'^##### (.+)$', re.MULTILINE)
+_RE_MD_H4 = re.compile(r'^#### (.+)$', re.MULTILINE)
+_RE_MD_H3 = re.compile(r'^### (.+)$', re.MULTILINE)
+_RE_MD_H2 = re.compile(r'^## (.+)$', re.MULTILINE)
+_RE_MD_H1 = re.compile(r'^# (.+)$', re.MULTILINE)
+_RE_BOLD_ITAL = re.compile(r'\*\*\*(.+?)\*\*\*')
+_RE_BOLD = re.compile(r'\*\*(.+?)\*\*')
+_RE_ITAL = re.compile(r'\*(.+?)\*')
+_RE_MD_IMG = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+_RE_MD_LINK = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_RE_HR_MD = re.compile(r'^---+$', re.MULTILINE)
+# Line kinds for markdown_to_html's walk: group 1 bullet item, group 2
+# numbered item, group 3 block-level tag (inline tags stay in paragraphs)
+_RE_LINE_KIND = re.compile(r'([-*] )|(\d+\. )|(<(?!a|strong|em|img))')
+
+# Placeholders for content set aside during conversion; indices are written
+# without leading zeros, so only those forms are restored
+_RE_TABLE_PLACEHOLDER = re.compile(r'__HTML_TABLE_(0|[1-9][0-9]*)__')
+# markdown_to_html's placeholders, restored in one pass: group 1 code block,
+# group 2 inline code, group 3 table
+_RE_MD_PLACEHOLDER = re.compile(
+    r'__CODE_BLOCK_(0|[1-9][0-9]*)__|__INLINE_CODE_(0|[1-9][0-9]*)__|<__HTML_TABLE_(0|[1-9][0-9]*)__/>'
+)
+
+
+def _restorer(saved: list, render):
+    """Build a re.sub callback putting render(saved[i]) back for placeholder i.
+
+    Placeholders whose index is out of range are left alone, matching text
+    that merely looks like a placeholder.
+    """
+    def restore(m):
+        index = int(m.group(1))
+        return render(saved[index]) if index < len(saved) else m.group(0)
+    return restore
+
 
 def html_to_markdown(html_content: str) -> str:
     """Convert Canvas HTML to Markdown.
@@ -25,81 +94,74 @@ def html_to_markdown(html_content: str) -> str:
     def save_html_table(m):
         html_tables.append(m.group(0))
         return f"__HTML_TABLE_{len(html_tables)-1}__"
-    text = re.sub(r'<table[^>]*>.*?</table>', save_html_table, text, flags=re.DOTALL | re.IGNORECASE)
+    text = _RE_TABLE.sub(save_html_table, text)
 
     # Decode HTML entities
     text = html.unescape(text)
 
     # Remove style and script tags completely
-    text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<script[^>]*>.*?</script>', '', text, flags=re.DOTALL | re.IGNORECASE)
+    text = _RE_STYLE_SCRIPT.sub('', text)
 
     # Headers
-    text = re.sub(r'<h1[^>]*>(.*?)</h1>', r'# \1\n', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<h2[^>]*>(.*?)</h2>', r'## \1\n', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<h3[^>]*>(.*?)</h3>', r'### \1\n', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<h4[^>]*>(.*?)</h4>', r'#### \1\n', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<h5[^>]*>(.*?)</h5>', r'##### \1\n', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<h6[^>]*>(.*?)</h6>', r'###### \1\n', text, flags=re.DOTALL | re.IGNORECASE)
+    text = _RE_HEADING.sub(lambda m: f"{'#' * int(m.group(1))} {m.group(2)}\n", text)
 
     # Bold and italic
-    text = re.sub(r'<strong[^>]*>(.*?)</strong>', r'**\1**', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<b[^>]*>(.*?)</b>', r'**\1**', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<em[^>]*>(.*?)</em>', r'*\1*', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<i[^>]*>(.*?)</i>', r'*\1*', text, flags=re.DOTALL | re.IGNORECASE)
+    text = _RE_STRONG.sub(r'**\1**', text)
+    text = _RE_B.sub(r'**\1**', text)
+    text = _RE_EM.sub(r'*\1*', text)
+    text = _RE_I.sub(r'*\1*', text)
 
     # Links
-    text = re.sub(r'<a[^>]*href="([^"]*)"[^>]*>(.*?)</a>', r'[\2](\1)', text, flags=re.DOTALL | re.IGNORECASE)
+    text = _RE_A.sub(r'[\2](\1)', text)
 
     # Images
-    text = re.sub(r'<img[^>]*src="([^"]*)"[^>]*alt="([^"]*)"[^>]*/?>', r'![\2](\1)', text, flags=re.IGNORECASE)
-    text = re.sub(r'<img[^>]*src="([^"]*)"[^>]*/?>', r'![](\1)', text, flags=re.IGNORECASE)
+    text = _RE_IMG_ALT.sub(r'![\2](\1)', text)
+    text = _RE_IMG.sub(r'![](\1)', text)
 
     # Lists - handle nested lists by processing multiple times
     # Unordered lists
-    text = re.sub(r'<ul[^>]*>', '\n', text, flags=re.IGNORECASE)
-    text = re.sub(r'</ul>', '\n', text, flags=re.IGNORECASE)
-    text = re.sub(r'<li[^>]*>(.*?)</li>', r'- \1\n', text, flags=re.DOTALL | re.IGNORECASE)
+    text = _RE_UL_OPEN.sub('\n', text)
+    text = _RE_UL_CLOSE.sub('\n', text)
+    text = _RE_LI.sub(r'- \1\n', text)
 
     # Ordered lists (simplified - doesn't maintain numbering)
-    text = re.sub(r'<ol[^>]*>', '\n', text, flags=re.IGNORECASE)
-    text = re.sub(r'</ol>', '\n', text, flags=re.IGNORECASE)
+    text = _RE_OL_OPEN.sub('\n', text)
+    text = _RE_OL_CLOSE.sub('\n', text)
 
     # Blockquotes
-    text = re.sub(r'<blockquote[^>]*>(.*?)</blockquote>', lambda m: '> ' + m.group(1).replace('\n', '\n> '), text, flags=re.DOTALL | re.IGNORECASE)
+    text = _RE_BLOCKQUOTE.sub(lambda m: '> ' + m.group(1).replace('\n', '\n> '), text)
 
     # Code blocks
-    text = re.sub(r'<pre[^>]*><code[^>]*>(.*?)</code></pre>', r'```\n\1\n```', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<code[^>]*>(.*?)</code>', r'`\1`', text, flags=re.DOTALL | re.IGNORECASE)
+    text = _RE_PRE_CODE.sub(r'```\n\1\n```', text)
+    text = _RE_CODE.sub(r'`\1`', text)
 
     # Horizontal rules
-    text = re.sub(r'<hr[^>]*/?>', '\n---\n', text, flags=re.IGNORECASE)
+    text = _RE_HR.sub('\n---\n', text)
 
     # Paragraphs and line breaks
-    text = re.sub(r'<p[^>]*>(.*?)</p>', r'\1\n\n', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<br[^>]*/?>', '\n', text, flags=re.IGNORECASE)
+    text = _RE_P.sub(r'\1\n\n', text)
+    text = _RE_BR.sub('\n', text)
 
     # Divs and spans (just extract content)
-    text = re.sub(r'<div[^>]*>(.*?)</div>', r'\1\n', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<span[^>]*>(.*?)</span>', r'\1', text, flags=re.DOTALL | re.IGNORECASE)
+    text = _RE_DIV.sub(r'\1\n', text)
+    text = _RE_SPAN.sub(r'\1', text)
 
     # Note: Tables are preserved as HTML (extracted earlier) - no conversion needed
 
     # Remove remaining HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _RE_TAG.sub('', text)
 
     # Clean up whitespace
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    text = re.sub(r' +', ' ', text)
+    text = _RE_MULTI_NL.sub('\n\n', text)
+    text = _RE_MULTI_SPACE.sub(' ', text)
     text = text.strip()
 
-    # Restore preserved HTML tables
-    for i, table in enumerate(html_tables):
-        text = text.replace(f"__HTML_TABLE_{i}__", f"\n\n{table}\n\n")
-
-    # Final cleanup of any extra newlines from table restoration
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    text = text.strip()
+    # Restore preserved HTML tables, then clean up any extra newlines that adds
+    # (without tables the text is already clean, so the second pass is skipped)
+    if html_tables:
+        text = _RE_TABLE_PLACEHOLDER.sub(_restorer(html_tables, lambda table: f"\n\n{table}\n\n"), text)
+        text = _RE_MULTI_NL.sub('\n\n', text)
+        text = text.strip()
 
     return text
 
@@ -124,119 +186,118 @@ def markdown_to_html(markdown_content: str) -> str:
     def save_html_table(m):
         html_tables.append(m.group(0))
         return f"<__HTML_TABLE_{len(html_tables)-1}__/>"
-    text = re.sub(r'<table[^>]*>.*?</table>', save_html_table, text, flags=re.DOTALL | re.IGNORECASE)
+    text = _RE_TABLE.sub(save_html_table, text)
 
     # Code blocks (do first to protect content)
     code_blocks = []
     def save_code_block(m):
         code_blocks.append(m.group(1))
         return f"__CODE_BLOCK_{len(code_blocks)-1}__"
-    text = re.sub(r'```\n?(.*?)\n?```', save_code_block, text, flags=re.DOTALL)
+    text = _RE_CODE_BLOCK.sub(save_code_block, text)
 
     # Inline code
     inline_codes = []
     def save_inline_code(m):
         inline_codes.append(m.group(1))
         return f"__INLINE_CODE_{len(inline_codes)-1}__"
-    text = re.sub(r'`([^`]+)`', save_inline_code, text)
+    text = _RE_INLINE_CODE.sub(save_inline_code, text)
 
     # Headers
-    text = re.sub(r'^###### (.+)$', r'<h6>\1</h6>', text, flags=re.MULTILINE)
-    text = re.sub(r'^##### (.+)$', r'<h5>\1</h5>', text, flags=re.MULTILINE)
-    text = re.sub(r'^#### (.+)$', r'<h4>\1</h4>', text, flags=re.MULTILINE)
-    text = re.sub(r'^### (.+)$', r'<h3>\1</h3>', text, flags=re.MULTILINE)
-    text = re.sub(r'^## (.+)$', r'<h2>\1</h2>', text, flags=re.MULTILINE)
-    text = re.sub(r'^# (.+)$', r'<h1>\1</h1>', text, flags=re.MULTILINE)
+    text = _RE_MD_H6.sub(r'<h6>\1</h6>', text)
+    text = _RE_MD_H5.sub(r'<h5>\1</h5>', text)
+    text = _RE_MD_H4.sub(r'<h4>\1</h4>', text)
+    text = _RE_MD_H3.sub(r'<h3>\1</h3>', text)
+    text = _RE_MD_H2.sub(r'<h2>\1</h2>', text)
+    text = _RE_MD_H1.sub(r'<h1>\1</h1>', text)
 
     # Bold and italic
-    text = re.sub(r'\*\*\*(.+?)\*\*\*', r'<strong><em>\1</em></strong>', text)
-    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-    text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
+    text = _RE_BOLD_ITAL.sub(r'<strong><em>\1</em></strong>', text)
+    text = _RE_BOLD.sub(r'<strong>\1</strong>', text)
+    text = _RE_ITAL.sub(r'<em>\1</em>', text)
 
     # Links and images
-    text = re.sub(r'!\[([^\]]*)\]\(([^)]+)\)', r'<img src="\2" alt="\1" />', text)
-    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', text)
+    text = _RE_MD_IMG.sub(r'<img src="\2" alt="\1" />', text)
+    text = _RE_MD_LINK.sub(r'<a href="\2">\1</a>', text)
 
     # Horizontal rules
-    text = re.sub(r'^---+$', '<hr />', text, flags=re.MULTILINE)
+    text = _RE_HR_MD.sub('<hr />', text)
 
-    # Lists (simplified)
-    lines = text.split('\n')
+    # Lists, blockquotes and paragraphs (simplified), in one walk over the lines
+    result_lines = []
+    para_buffer = []
     in_ul = False
     in_ol = False
-    result_lines = []
 
-    for line in lines:
+    def flush_para():
+        if para_buffer:
+            content = ' '.join(para_buffer)
+            result_lines.append(f'<p>{content}</p>')
+            para_buffer.clear()
+
+    for line in text.split('\n'):
         stripped = line.strip()
+        match = _RE_LINE_KIND.match(stripped)
+        kind = match.lastindex if match else None
 
         # Unordered list
-        if stripped.startswith('- ') or stripped.startswith('* '):
+        if kind == 1:
+            flush_para()
             if not in_ul:
                 result_lines.append('<ul>')
                 in_ul = True
             result_lines.append(f'<li>{stripped[2:]}</li>')
+            continue
+
         # Ordered list
-        elif re.match(r'^\d+\. ', stripped):
+        if kind == 2:
+            flush_para()
             if not in_ol:
                 result_lines.append('<ol>')
                 in_ol = True
-            content = re.sub(r'^\d+\. ', '', stripped)
-            result_lines.append(f'<li>{content}</li>')
-        else:
-            if in_ul:
-                result_lines.append('</ul>')
-                in_ul = False
-            if in_ol:
-                result_lines.append('</ol>')
-                in_ol = False
-            result_lines.append(line)
-
-    if in_ul:
-        result_lines.append('</ul>')
-    if in_ol:
-        result_lines.append('</ol>')
-
-    text = '\n'.join(result_lines)
-
-    # Blockquotes
-    text = re.sub(r'^> (.+)$', r'<blockquote>\1</blockquote>', text, flags=re.MULTILINE)
-
-    # Paragraphs - wrap non-tag lines
-    lines = text.split('\n')
-    result_lines = []
-    para_buffer = []
-
-    def flush_para():
-        if para_buffer:
-            content = ' '.join(para_buffer)
-            result_lines.append(f'<p>{content}</p>')
-            para_buffer.clear()
-
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
+            result_lines.append(f'<li>{stripped[match.end():]}</li>')
+            continue
+
+        # Any other line closes open lists (nothing is buffered while a list is open)
+        if in_ul:
+            result_lines.append('</ul>')
+            in_ul = False
+        if in_ol:
+            result_lines.append('</ol>')
+            in_ol = False
+
+        # Blockquotes, then paragraphs - wrap non-tag lines
+        if line.startswith('> ') and len(line) > 2:
+            flush_para()
+            result_lines.append(f'<blockquote>{line[2:]}</blockquote>')
+        elif not stripped:
             flush_para()
-        elif stripped.startswith('<') and not stripped.startswith('<a') and not stripped.startswith('<strong') and not stripped.startswith('<em') and not stripped.startswith('<img'):
+        elif kind == 3:
             flush_para()
             result_lines.append(line)
         else:
             para_buffer.append(stripped)
 
+    if in_ul:
+        result_lines.append('</ul>')
+    if in_ol:
+        result_lines.append('</ol>')
     flush_para()
     text = '\n'.join(result_lines)
 
-    # Restore code blocks
-    for i, code in enumerate(code_blocks):
-        escaped_code = html.escape(code)
-        text = text.replace(f"__CODE_BLOCK_{i}__", f'<pre><code>{escaped_code}</code></pre>')
-
-    # Restore inline code
-    for i, code in enumerate(inline_codes):
-        escaped_code = html.escape(code)
-        text = text.replace(f"__INLINE_CODE_{i}__", f'<code>{escaped_code}</code>')
-
-    # Restore HTML tables (preserved exactly as they were)
-    for i, table in enumerate(html_tables):
-        text = text.replace(f"<__HTML_TABLE_{i}__/>", table)
+    # Restore code blocks, inline code and HTML tables (preserved exactly as
+    # they were) in one pass, so restored content is never rescanned
+    if code_blocks or inline_codes or html_tables:
+        rendered = (
+            [f'<pre><code>{html.escape(code)}</code></pre>' for code in code_blocks],
+            [f'<code>{html.escape(code)}</code>' for code in inline_codes],
+            html_tables,
+        )
+
+        def restore(m):
+            saved = rendered[m.lastindex - 1]
+            index = int(m.group(m.lastindex))
+            return saved[index] if index < len(saved) else m.group(0)
+
+        text = _RE_MD_PLACEHOLDER.sub(restore, text)
 
     return text
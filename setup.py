@@ -9,8 +9,13 @@ setup(
     install_requires=[
         "click>=8.0",
         "requests>=2.28",
+        "urllib3>=1.26",
         "pyyaml>=6.0",
     ],
+    extras_require={
+        # Optional: brotli-compressed API responses and faster JSON
+        "speedups": ["brotli", "orjson"],
+    },
     entry_points={
         "console_scripts": [
             "canvas=canvas_cli.cli:main",
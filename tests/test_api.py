@@ -0,0 +1,363 @@
+import json
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+import requests
+from requests.adapters import BaseAdapter
+
+from canvas_cli import api as api_module
+from canvas_cli.api import CanvasAPI, install_dns_cache, iter_discussion_entries
+
+
+class FakeAdapter(BaseAdapter):
+    """Transport adapter serving canned JSON responses keyed by path."""
+
+    def __init__(self, routes):
+        super().__init__()
+        self.routes = routes
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.requests.append(request)
+        # Routes may be keyed by full path + query (for specific pages) or by path
+        route = self.routes.get(request.path_url) or self.routes.get(request.path_url.split("?")[0])
+        status, body, headers = route or (404, {"errors": "not found"}, {})
+        if callable(status):
+            status = status(request)
+        if callable(body):
+            body = body(request)
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response._content = json.dumps(body).encode()
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def make_api(routes, **kwargs):
+    api = CanvasAPI("https://canvas.example.edu", "token", **kwargs)
+    adapter = FakeAdapter(routes)
+    api.session.mount("https://", adapter)
+    return api, adapter
+
+
+class CanvasAPITests(unittest.TestCase):
+    def test_get_module_item_contents_preserves_item_order(self):
+        routes = {
+            "/api/v1/courses/1/pages/intro": (200, {"url": "intro", "title": "Intro"}, {}),
+            "/api/v1/courses/1/assignments/7": (200, {"id": 7, "name": "Essay"}, {}),
+            "/api/v1/courses/1/discussion_topics/9": (200, {"id": 9, "title": "Talk"}, {}),
+        }
+        api, adapter = make_api(routes)
+        items = [
+            {"type": "Assignment", "content_id": 7},
+            {"type": "SubHeader", "title": "Week 1"},
+            {"type": "Page", "page_url": "intro"},
+            {"type": "Discussion", "content_id": 9},
+        ]
+
+        contents = api.get_module_item_contents(1, items)
+
+        self.assertEqual(contents[0]["name"], "Essay")
+        self.assertIsNone(contents[1])
+        self.assertEqual(contents[2]["title"], "Intro")
+        self.assertEqual(contents[3]["title"], "Talk")
+        self.assertEqual(len(adapter.requests), 3)
+
+    def test_get_is_cached_until_endpoint_is_modified(self):
+        routes = {
+            "/api/v1/courses/1/assignments/7": (200, {"id": 7, "name": "Essay"}, {}),
+            "/api/v1/courses/1/assignments/70": (200, {"id": 70, "name": "Other"}, {}),
+        }
+        api, adapter = make_api(routes)
+
+        api.get_assignment(1, 7)
+        api.get_assignment(1, 7)
+        api.get_assignment(1, 70)
+        self.assertEqual(len(adapter.requests), 2)
+
+        api.update_assignment(1, 7, name="Essay 1")
+        api.get_assignment(1, 7)
+        api.get_assignment(1, 70)
+        self.assertEqual(
+            [r.method for r in adapter.requests],
+            ["GET", "GET", "PUT", "GET"],
+        )
+
+    def test_cache_key_includes_params(self):
+        routes = {"/api/v1/courses/1/rubrics/3": (200, {"id": 3}, {})}
+        api, adapter = make_api(routes)
+
+        api.get_rubric(1, 3)
+        api._get("courses/1/rubrics/3")
+        api.get_rubric(1, 3)
+        self.assertEqual(len(adapter.requests), 2)
+
+    def test_concurrent_identical_gets_share_one_request(self):
+        def slow_rubric(request):
+            time.sleep(0.2)
+            return {"id": 3}
+
+        routes = {"/api/v1/courses/1/rubrics/3": (200, slow_rubric, {})}
+        api, adapter = make_api(routes, cache_ttl=0)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: api.get_rubric(1, 3), range(4)))
+
+        self.assertEqual(results, [{"id": 3}] * 4)
+        self.assertEqual(len(adapter.requests), 1)
+
+    def test_bulk_update_submissions_posts_grade_data_and_waits(self):
+        routes = {
+            "/api/v1/courses/1/assignments/7/submissions/update_grades": (
+                200, {"id": 5, "url": "https://canvas.example.edu/api/v1/progress/5"}, {}
+            ),
+            "/api/v1/progress/5": (200, {"id": 5, "workflow_state": "completed"}, {}),
+        }
+        api, adapter = make_api(routes)
+
+        progress = api.bulk_update_submissions(1, 7, {
+            11: {"posted_grade": "A"},
+            12: {"posted_grade": "B", "text_comment": "Nice work"},
+        })
+        self.assertEqual(api.wait_for_progress(progress["url"], poll=0)["workflow_state"], "completed")
+
+        body = json.loads(adapter.requests[0].body)
+        self.assertEqual(body["grade_data"]["11"], {"posted_grade": "A"})
+        self.assertEqual(body["grade_data"]["12"]["text_comment"], "Nice work")
+
+    def test_content_type_only_sent_with_a_body(self):
+        routes = {"/api/v1/courses/1/pages/intro": (200, {"url": "intro"}, {})}
+        api, adapter = make_api(routes)
+
+        api.get_page(1, "intro")
+        api.update_page(1, "intro", body="<p>Hi</p>")
+        api._delete("courses/1/pages/intro")
+
+        get, put, delete = adapter.requests
+        self.assertNotIn("Content-Type", get.headers)
+        self.assertEqual(put.headers["Content-Type"], "application/json")
+        self.assertEqual(json.loads(put.body), {"wiki_page": {"body": "<p>Hi</p>"}})
+        self.assertNotIn("Content-Type", delete.headers)
+
+    def test_etag_cache_revalidates_with_if_none_match(self):
+        def course(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return None
+            return {"id": 1, "name": "Ethics"}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            routes = {"/api/v1/courses/1": (200, course, {"ETag": '"v1"'})}
+            api, adapter = make_api(routes, cache_ttl=0, etag_cache_dir=tmp)
+            self.assertEqual(api.get_course(1)["name"], "Ethics")
+
+            # A fresh client (e.g. the next CLI run) gets a 304 and reuses the stored body
+            routes["/api/v1/courses/1"] = (304, course, {"ETag": '"v1"'})
+            api, adapter = make_api(routes, cache_ttl=0, etag_cache_dir=tmp)
+            self.assertEqual(api.get_course(1)["name"], "Ethics")
+            self.assertEqual(adapter.requests[0].headers["If-None-Match"], '"v1"')
+
+    def test_etag_304_without_usable_stored_body_refetches_in_full(self):
+        def status(request):
+            return 304 if "If-None-Match" in request.headers else 200
+
+        with tempfile.TemporaryDirectory() as tmp:
+            routes = {"/api/v1/courses/1": (status, {"id": 1, "name": "Ethics"}, {"ETag": '"v1"'})}
+            api, adapter = make_api(routes, cache_ttl=0, etag_cache_dir=tmp)
+            api.get_course(1)
+
+            # A damaged entry still carries the validator, so Canvas answers 304
+            for entry in Path(tmp).glob("*.json"):
+                entry.write_text('{"etag": "\\"v1\\""}')
+            api, adapter = make_api(routes, cache_ttl=0, etag_cache_dir=tmp)
+            self.assertEqual(api.get_course(1)["name"], "Ethics")
+
+            revalidate, refetch = adapter.requests
+            self.assertEqual(revalidate.headers["If-None-Match"], '"v1"')
+            self.assertNotIn("If-None-Match", refetch.headers)
+            self.assertEqual(refetch.headers["Cache-Control"], "no-cache")
+
+            # A 304 that keeps coming without anything cached is a clear error
+            routes["/api/v1/courses/2"] = (304, None, {})
+            with self.assertRaisesRegex(requests.HTTPError, "no cached body"):
+                api.get_course(2)
+
+    def test_paginate_follows_link_urls_containing_commas(self):
+        next_url = "https://canvas.example.edu/api/v1/courses/1/pages?include%5B%5D=body,lock_info&page=2"
+        routes = {
+            "/api/v1/courses/1/pages?per_page=100": (200, [{"url": "a"}], {
+                "Link": f'<{next_url}>; rel="next", '
+                        '<https://canvas.example.edu/api/v1/courses/1/pages?page=1>; rel="first"',
+            }),
+            "/api/v1/courses/1/pages?include%5B%5D=body,lock_info&page=2": (200, [{"url": "b"}], {}),
+        }
+        api, adapter = make_api(routes)
+
+        pages = list(api.get_pages(1))
+
+        self.assertEqual([p["url"] for p in pages], ["a", "b"])
+        self.assertEqual(adapter.requests[1].url, next_url)
+
+    def test_next_page_is_prefetched_while_current_page_is_consumed(self):
+        page2_requested = threading.Event()
+
+        def page2(request):
+            page2_requested.set()
+            return [{"id": 2}]
+
+        base = "https://canvas.example.edu/api/v1/courses/1/modules"
+        routes = {
+            "/api/v1/courses/1/modules?per_page=100": (200, [{"id": 1}], {"Link": f'<{base}?page=2>; rel="next"'}),
+            "/api/v1/courses/1/modules?page=2": (200, page2, {"Link": f'<{base}?page=3>; rel="next"'}),
+            "/api/v1/courses/1/modules?page=3": (200, [{"id": 3}], {}),
+        }
+        api, adapter = make_api(routes, cache_ttl=0)
+
+        modules = api.get_modules(1)
+        self.assertEqual(next(modules)["id"], 1)
+        # Page 2 is requested without the caller asking for more items
+        self.assertTrue(page2_requested.wait(timeout=2))
+        self.assertEqual(next(modules)["id"], 2)
+
+        # Stopping early leaves no further pages requested beyond the one in flight
+        modules.close()
+        deadline = time.monotonic() + 2
+        while len(adapter.requests) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual([r.path_url for r in adapter.requests][-1], "/api/v1/courses/1/modules?page=3")
+        self.assertEqual(len(adapter.requests), 3)
+
+    def test_course_overview_is_one_cached_graphql_call(self):
+        overview = {
+            "modulesConnection": {"nodes": [{"_id": "3", "name": "Week 1"}]},
+            "assignmentsConnection": {"nodes": []},
+            "pagesConnection": {"nodes": []},
+        }
+        routes = {
+            "/api/graphql": (200, {"data": {"course": overview}}, {}),
+            "/api/v1/courses/1/pages/intro": (200, {"url": "intro"}, {}),
+        }
+        api, adapter = make_api(routes)
+
+        self.assertEqual(api.get_course_overview(1), overview)
+        self.assertEqual(api.get_course_overview(1), overview)
+        self.assertEqual(json.loads(adapter.requests[0].body)["variables"], {"id": "1"})
+        self.assertEqual(len(adapter.requests), 1)
+
+        # Changing anything in the course drops the cached overview
+        api.update_page(1, "intro", body="")
+        api.get_course_overview(1)
+        self.assertEqual(len(adapter.requests), 3)
+
+    def test_warm_up_sends_head_through_session_and_swallows_connection_errors(self):
+        # Run the background thread's target inline so its outcome is observable
+        inline_thread = lambda target, daemon: mock.Mock(start=target)
+        api, adapter = make_api({"/api/v1/users/self": (200, {"id": 1}, {})})
+
+        with mock.patch.object(api_module, "Thread", inline_thread):
+            api.warm_up()
+        self.assertEqual([(r.method, r.path_url) for r in adapter.requests], [("HEAD", "/api/v1/users/self")])
+
+        def refuse(request, **kwargs):
+            raise requests.ConnectionError("connection refused")
+
+        with mock.patch.object(adapter, "send", refuse), mock.patch.object(api_module, "Thread", inline_thread):
+            api.warm_up()
+
+    def test_iter_discussion_entries_is_preorder_with_depth(self):
+        data = {"view": [
+            {"id": 1, "replies": [
+                {"id": 2, "replies": [{"id": 3}]},
+                {"id": 4, "replies": None},
+            ]},
+            {"id": 5},
+        ]}
+
+        walked = [(entry["id"], depth) for entry, depth in iter_discussion_entries(data)]
+
+        self.assertEqual(walked, [(1, 0), (2, 1), (3, 2), (4, 1), (5, 0)])
+
+    def test_parallel_starmap_returns_results_in_input_order(self):
+        def submission(request):
+            user_id = int(request.path_url.rsplit("/", 1)[1].split("?")[0])
+            time.sleep(0.01 * (5 - user_id))
+            return {"user_id": user_id}
+
+        routes = {f"/api/v1/courses/1/assignments/7/submissions/{uid}": (200, submission, {})
+                  for uid in range(1, 5)}
+        api, adapter = make_api(routes)
+
+        results = api.parallel_starmap(api.get_submission, [(1, 7, uid) for uid in range(1, 5)])
+
+        self.assertEqual([r["user_id"] for r in results], [1, 2, 3, 4])
+
+
+
+class DnsCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.lookups = []
+
+        def lookup(host, port, *args, **kwargs):
+            self.lookups.append((host, port))
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (f"10.0.0.{len(self.lookups)}", port))]
+
+        patches = [
+            mock.patch.object(api_module, "_original_getaddrinfo", lookup),
+            mock.patch.object(api_module, "_dns_cache", {}),
+            mock.patch.object(api_module, "_dns_hosts", {}),
+            mock.patch.object(socket, "getaddrinfo", socket.getaddrinfo),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_lookups_are_cached_per_host_and_port_for_registered_hosts_only(self):
+        install_dns_cache("https://canvas.example.edu", ttl=60)
+
+        first = socket.getaddrinfo("canvas.example.edu", 443)
+        self.assertEqual(socket.getaddrinfo("canvas.example.edu", 443), first)
+        socket.getaddrinfo("canvas.example.edu", 80)
+        socket.getaddrinfo("other.example.com", 443)
+        socket.getaddrinfo("other.example.com", 443)
+
+        self.assertEqual(self.lookups, [
+            ("canvas.example.edu", 443), ("canvas.example.edu", 80),
+            ("other.example.com", 443), ("other.example.com", 443),
+        ])
+
+    def test_entries_expire_after_ttl(self):
+        install_dns_cache("https://canvas.example.edu", ttl=60)
+
+        with mock.patch.object(api_module.time, "monotonic", return_value=1000.0):
+            first = socket.getaddrinfo("canvas.example.edu", 443)
+        with mock.patch.object(api_module.time, "monotonic", return_value=1059.0):
+            self.assertEqual(socket.getaddrinfo("canvas.example.edu", 443), first)
+        with mock.patch.object(api_module.time, "monotonic", return_value=1061.0):
+            self.assertNotEqual(socket.getaddrinfo("canvas.example.edu", 443), first)
+
+        self.assertEqual(len(self.lookups), 2)
+
+    def test_installing_twice_does_not_wrap_twice(self):
+        install_dns_cache("https://canvas.example.edu")
+        install_dns_cache("https://canvas.example.edu/courses/1")
+
+        self.assertIs(socket.getaddrinfo, api_module._caching_getaddrinfo)
+        socket.getaddrinfo("canvas.example.edu", 443)
+        self.assertEqual(len(self.lookups), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,334 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import yaml
+from click.testing import CliRunner
+
+from canvas_cli.cli import (
+    _count_course_files, _dump_frontmatter, _index_entry, _is_current, cli, find_course_meta, find_module_dir,
+    match_assignments, matches_name, parse_markdown_file, save_discussion_entries, save_page, save_rubric,
+    save_submission, slugify,
+)
+from canvas_cli.config import load_config
+from test_api import make_api
+
+
+class CliHelperTests(unittest.TestCase):
+    def test_slugify_strips_unsafe_characters_and_collapses_whitespace(self):
+        self.assertEqual(slugify("Week 1: Intro / Overview?"), "Week-1-Intro-Overview")
+        self.assertEqual(slugify("  A  -  B  "), "A-B")
+        self.assertEqual(slugify("x ?"), "x")
+        self.assertEqual(len(slugify("word " * 50)), 100)
+
+    def test_matches_name_respects_number_boundaries(self):
+        self.assertTrue(matches_name("1.5", "1.5 Assignment"))
+        self.assertFalse(matches_name("1.5", "11.5 Assignment"))
+        self.assertTrue(matches_name("Module 1", "Module 1 - Intro"))
+        self.assertFalse(matches_name("Module 1", "Module 10"))
+        self.assertTrue(matches_name(" essay ", "Final Essay (Draft)"))
+        self.assertFalse(matches_name("ess", "Final Essay"))
+
+    def test_match_assignments_takes_first_match_per_name(self):
+        assignments = [
+            {"id": 1, "name": "11.5 Reflection"},
+            {"id": 2, "name": "1.5 Assignment"},
+            {"id": 3, "name": "1.5 Assignment (Late)"},
+            {"id": 4, "name": "2.4 Discussion"},
+        ]
+
+        matched = match_assignments(("1.5", "2.4 ", "9.9", "1.5"), assignments)
+
+        self.assertEqual({name: a["id"] for name, a in matched.items()}, {"1.5": 2, "2.4 ": 4})
+
+    def test_dump_frontmatter_matches_yaml_dump(self):
+        samples = [
+            {"canvas_id": 316993, "title": "1.5 Assignment", "due_at": "2026-01-26T06:59:59Z",
+             "points_possible": 20.0, "submission_types": ["online_text_entry", "online_upload"],
+             "published": True, "rubric_id": None},
+            {"title": "Week 1 Intro", "canvas_url": "week-1-intro", "published": False},
+            {"title": "Yes", "student": "Ada: The Sequel", "status": "graded #1", "empty": ""},
+            {"title": "Reading " * 12, "unicode": "Café"},
+            {"title": "Semaine 3 : Lecture — Introduction à la littérature française contemporaine et ses enjeux"},
+            {"title": "Week 4 😀 " * 10},
+        ]
+        for frontmatter in samples:
+            self.assertEqual(
+                _dump_frontmatter(frontmatter),
+                yaml.dump(frontmatter, default_flow_style=False).strip(),
+            )
+
+    def test_save_rubric_writes_unicode_literally(self):
+        rubric = {"id": 3, "title": "Essay", "data": [{"id": "c1", "description": "Voice 😀 café", "ratings": []}]}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            content = save_rubric(Path(tmp), rubric).read_text(encoding="utf-8")
+
+        self.assertIn("title: Voice 😀 café\n", content)
+
+    def test_save_page_leaves_unchanged_file_untouched(self):
+        page = {"page_id": 5, "url": "intro", "title": "Intro", "body": "<p>Hello</p>"}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            filepath = save_page(Path(tmp), page)
+            os.utime(filepath, (0, 0))
+
+            save_page(Path(tmp), page)
+            self.assertEqual(filepath.stat().st_mtime, 0)
+
+            save_page(Path(tmp), dict(page, body="<p>Changed</p>"))
+            self.assertNotEqual(filepath.stat().st_mtime, 0)
+            self.assertIn("Changed", filepath.read_text())
+
+    def test_pull_index_entry_is_current_until_canvas_or_local_file_changes(self):
+        page = {"page_id": 5, "url": "intro", "title": "Intro", "body": "", "updated_at": "2026-01-01T00:00:00Z"}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            course_dir = Path(tmp)
+            filepath = save_page(course_dir, page)
+            entry = _index_entry(course_dir, filepath, page["updated_at"])
+
+            self.assertEqual(entry["file"], "pages/Intro.md")
+            self.assertTrue(_is_current(course_dir, entry, "2026-01-01T00:00:00Z"))
+            self.assertFalse(_is_current(course_dir, entry, "2026-02-01T00:00:00Z"))
+            self.assertFalse(_is_current(course_dir, None, "2026-01-01T00:00:00Z"))
+
+            os.utime(filepath, ns=(0, entry["mtime_ns"] + 1))
+            self.assertFalse(_is_current(course_dir, entry, "2026-01-01T00:00:00Z"))
+
+    def test_save_discussion_entries_formats_replies_and_counts_posts(self):
+        view = {
+            "participants": [{"id": 1, "display_name": "Ada"}, {"id": 2, "display_name": "Grace"}],
+            "view": [
+                {"user_id": 1, "created_at": "2026-01-05T10:00:00Z", "message": "<p>First</p><p>post</p>",
+                 "replies": [{"user_id": 2, "created_at": "2026-01-06T10:00:00Z", "message": "Reply<br/>here"}]},
+                {"user_id": 3, "message": "Second"},
+            ],
+        }
+        routes = {"/api/v1/courses/1/discussion_topics/9/view": (200, view, {})}
+        api, adapter = make_api(routes)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            filepath, count = save_discussion_entries(Path(tmp), "Week 1", 9, api, 1)
+            body = filepath.read_text().split("\n", 4)[4]
+
+        self.assertEqual(count, 2)
+        self.assertEqual(len(adapter.requests), 1)
+        self.assertEqual(body, (
+            "## Ada\n*Posted: 2026-01-05*\n\nFirst\npost\n\n**Replies:**\n\n"
+            "  ### Grace\n  *Posted: 2026-01-06*\n\n  Reply\n  here\n\n---\n\n"
+            "## Unknown\n*Posted: Unknown date*\n\nSecond\n\n---\n"
+        ))
+
+    def test_count_course_files_matches_status_globs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            course = Path(tmp)
+            for rel in ["a.md", "Week-1/b.md", "Week-1/c.yaml", "rubrics/r.yaml", "rubrics/old/r2.yaml",
+                        "rubrics/notes.md", "submissions/essay/s1.md", "submissions/essay/s1.docx",
+                        "submissions/s2.md", "_course.yaml"]:
+                (course / rel).parent.mkdir(parents=True, exist_ok=True)
+                (course / rel).write_text("")
+
+            expected = (
+                len(list(course.glob("**/*.md"))),
+                len(list(course.glob("rubrics/*.yaml"))),
+                len(list(course.glob("submissions/**/*.md"))),
+            )
+            self.assertEqual(_count_course_files(course), expected)
+            self.assertEqual(expected, (5, 1, 2))
+
+    def test_find_module_dir_skips_files_and_matches_case_insensitively(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            courses = Path(tmp)
+            (courses / "SP26-PHIL-123-codex-course" / "Week-2-Ethics").mkdir(parents=True)
+            (courses / "SP26-PHIL-123-codex-course" / "week-2-notes.md").write_text("")
+            (courses / "stray.md").write_text("")
+
+            found = find_module_dir(courses, "WEEK-2")
+            self.assertEqual(found, courses / "SP26-PHIL-123-codex-course" / "Week-2-Ethics")
+            self.assertIsNone(find_module_dir(courses, "Week-3"))
+
+    def test_find_course_meta_is_read_once_per_directory(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            course = Path(tmp) / "course"
+            (course / "Week-1" / "deep").mkdir(parents=True)
+            (course / "_course.yaml").write_text("canvas_id: 7\n")
+
+            self.assertEqual(find_course_meta(course / "Week-1" / "a.md")["canvas_id"], 7)
+            self.assertEqual(find_course_meta(course / "Week-1" / "deep" / "b.md")["canvas_id"], 7)
+            (course / "_course.yaml").write_text("canvas_id: 8\n")
+            self.assertEqual(find_course_meta(course / "Week-1" / "c.md")["canvas_id"], 7)
+            with self.assertRaises(FileNotFoundError):
+                find_course_meta(Path(tmp) / "elsewhere.md")
+
+    def test_find_course_meta_rejects_metadata_without_canvas_id(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, content in [("empty", ""), ("list", "- 7\n"), ("broken", "canvas_id: [7\n"),
+                                  ("no-id", "name: Ethics\n")]:
+                course = Path(tmp) / name
+                course.mkdir()
+                (course / "_course.yaml").write_text(content)
+
+                with self.assertRaisesRegex(FileNotFoundError, "has no canvas_id"):
+                    find_course_meta(course / "page.md")
+
+    def test_parse_markdown_file_splits_on_delimiter_lines_only(self):
+        cases = [
+            ("---\ntitle: A --- B\ncanvas_id: 3\n---\n\nBody --- text\n", {"title": "A --- B", "canvas_id": 3}, "Body --- text"),
+            ("---\r\ntitle: Win\r\n---\r\nBody\r\n", {"title": "Win"}, "Body"),
+            ("---\n---\nBody", {}, "Body"),
+            ("---\n- a list\n---\nBody", {}, "Body"),
+            ("No frontmatter\n---\nx", {}, "No frontmatter\n---\nx"),
+            ("---\ntitle: Unclosed\n", {}, "---\ntitle: Unclosed\n"),
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            filepath = Path(tmp) / "page.md"
+            for content, frontmatter, body in cases:
+                filepath.write_bytes(content.encode())
+                self.assertEqual(parse_markdown_file(filepath), (frontmatter, body))
+
+    def test_save_submission_downloads_attachments_in_order(self):
+        routes = {
+            "/files/1/download": (200, "first", {}),
+            "/files/3/download": (200, "third", {}),
+        }
+        api, adapter = make_api(routes)
+        submission = {
+            "user_id": 42,
+            "workflow_state": "submitted",
+            "attachments": [
+                {"url": "https://canvas.example.edu/files/1/download", "filename": "essay.docx"},
+                {"url": "https://canvas.example.edu/files/2/download", "filename": "missing.pdf"},
+                {"url": "https://canvas.example.edu/files/3/download", "filename": "notes.txt"},
+            ],
+        }
+
+        with tempfile.TemporaryDirectory() as tmp:
+            filepath = save_submission(Path(tmp), "Essay 1", submission, {"name": "Ada Lovelace"}, api=api)
+
+            folder = filepath.parent
+            self.assertEqual((folder / "Ada-Lovelace-1.docx").read_text(), '"first"')
+            self.assertEqual((folder / "Ada-Lovelace-3.txt").read_text(), '"third"')
+            self.assertFalse((folder / "Ada-Lovelace-2.pdf").exists())
+            self.assertIn("attachments:\n- Ada-Lovelace-1.docx\n- Ada-Lovelace-3.txt", filepath.read_text())
+
+
+class CommandTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / ".canvas-config.yaml").write_text(
+            yaml.dump({"canvas_url": "https://canvas.example.edu", "api_token": "token"})
+        )
+        self.old_cwd = Path.cwd()
+        os.chdir(self.root)
+
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+        load_config.cache_clear()
+        self.tmp.cleanup()
+
+    def invoke(self, routes, *args, exit_code=0):
+        api, adapter = make_api(routes, cache_ttl=0)
+        with mock.patch("canvas_cli.cli.get_api", return_value=api):
+            result = CliRunner().invoke(cli, list(args))
+        self.assertEqual(result.exit_code, exit_code, result.output)
+        return adapter, result.output
+
+    def pull(self, routes, *args):
+        return self.invoke(routes, "pull", "1", *args)[0]
+
+    def test_full_pull_fetches_pages_concurrently_and_skips_unchanged(self):
+        listing = [{"url": f"p{i}", "title": f"Page {i}", "updated_at": "2026-01-01T00:00:00Z"} for i in range(5)]
+        routes = {
+            "/api/v1/courses/1": (200, {"id": 1, "name": "Sandbox", "course_code": "SBX"}, {}),
+            "/api/v1/courses/1/pages": (200, listing, {}),
+            "/api/v1/courses/1/assignments": (200, [], {}),
+        }
+        for page in listing:
+            routes[f"/api/v1/courses/1/pages/{page['url']}"] = (
+                200, dict(page, page_id=1, body=f"<p>{page['title']}</p>"), {}
+            )
+
+        adapter = self.pull(routes, "--workers", "3")
+        pages_dir = self.root / "courses" / "codex-course" / "pages"
+        self.assertEqual(sorted(p.name for p in pages_dir.iterdir()), [f"Page-{i}.md" for i in range(5)])
+        self.assertEqual(sum("/pages/p" in r.path_url for r in adapter.requests), 5)
+
+        adapter = self.pull(routes)
+        self.assertEqual(sum("/pages/p" in r.path_url for r in adapter.requests), 0)
+
+    def test_push_module_pushes_files_concurrently_and_reports_failures(self):
+        module_dir = self.root / "courses" / "SP26-PHIL-123-codex-course" / "Week-1"
+        module_dir.mkdir(parents=True)
+        (module_dir.parent / "_course.yaml").write_text("canvas_id: 1\n")
+        for slug in ("intro", "missing", "outro"):
+            (module_dir / f"{slug}.md").write_text(f"---\ncanvas_id: 1\ncanvas_url: {slug}\ntitle: {slug}\n---\n\nHi\n")
+        (module_dir / "broken.md").write_text("---\ncanvas_id: [1\n---\n\nHi\n")
+        (module_dir / "notes.md").write_text("Local notes, never pushed\n")
+        routes = {
+            "/api/v1/courses/1/pages/intro": (200, {"url": "intro"}, {}),
+            "/api/v1/courses/1/pages/outro": (200, {"url": "outro"}, {}),
+        }
+
+        adapter, output = self.invoke(routes, "push", "-m", "week-1", exit_code=1)
+
+        self.assertEqual(sorted(r.path_url for r in adapter.requests if r.method == "PUT"), [
+            "/api/v1/courses/1/pages/intro", "/api/v1/courses/1/pages/missing", "/api/v1/courses/1/pages/outro",
+        ])
+        for slug in ("intro", "missing", "outro"):
+            self.assertIn(f"  Page: {slug}\n", output)
+        self.assertIn("Error pushing missing.md", output)
+        self.assertIn("Error pushing broken.md", output)
+        self.assertIn("Skipping notes.md: no canvas_id in frontmatter", output)
+        self.assertIn("1 file(s) skipped.", output)
+        self.assertIn("2 file(s) failed to push.", output)
+
+    def test_push_dry_run_skips_conversion_and_updates(self):
+        module_dir = self.root / "courses" / "SP26-PHIL-123-codex-course" / "Week-3"
+        module_dir.mkdir(parents=True)
+        (module_dir.parent / "_course.yaml").write_text("canvas_id: 1\n")
+        (module_dir / "intro.md").write_text("---\ncanvas_id: 1\ncanvas_url: intro\ntitle: Intro\n---\n\n# Hi\n")
+        (module_dir / "notes.md").write_text("Local notes, never pushed\n")
+
+        with mock.patch("canvas_cli.cli.markdown_to_html") as convert:
+            adapter, output = self.invoke({}, "push", "-m", "week-3", "--dry-run")
+
+        convert.assert_not_called()
+        self.assertEqual(adapter.requests, [])
+        self.assertIn("  Page: Intro\n", output)
+        self.assertIn("1 file(s) skipped.", output)
+        self.assertNotIn("failed", output)
+
+    def test_push_module_lists_discussion_topics_once(self):
+        module_dir = self.root / "courses" / "SP26-PHIL-123-codex-course" / "Week-2"
+        module_dir.mkdir(parents=True)
+        (module_dir.parent / "_course.yaml").write_text("canvas_id: 1\n")
+        for assignment_id in (7, 8, 9):
+            (module_dir / f"d{assignment_id}.md").write_text(
+                f"---\ncanvas_id: {assignment_id}\ntitle: D{assignment_id}\n"
+                "submission_types:\n- discussion_topic\n---\n\nPost\n"
+            )
+        routes = {
+            "/api/v1/courses/1/discussion_topics": (200, [
+                {"id": 70, "assignment_id": 7}, {"id": 80, "assignment_id": 8}, {"id": 5},
+            ], {}),
+            "/api/v1/courses/1/discussion_topics/70": (200, {"id": 70}, {}),
+            "/api/v1/courses/1/discussion_topics/80": (200, {"id": 80}, {}),
+        }
+
+        adapter, output = self.invoke(routes, "push", "-m", "week-2", exit_code=1)
+
+        listings = [r for r in adapter.requests if r.path_url.startswith("/api/v1/courses/1/discussion_topics?")]
+        self.assertEqual(len(listings), 1)
+        self.assertEqual(sorted(r.path_url for r in adapter.requests if r.method == "PUT"), [
+            "/api/v1/courses/1/discussion_topics/70", "/api/v1/courses/1/discussion_topics/80",
+        ])
+        self.assertIn("Could not find discussion topic for assignment 9", output)
+        self.assertIn("1 file(s) failed to push.", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import yaml
 
-from canvas_cli.config import get_course_folder, get_courses_dir, parse_course_info
+from canvas_cli.config import find_config_file, get_course_folder, get_courses_dir, load_config, parse_course_info, save_config
 
 
 class CanvasConfigTests(unittest.TestCase):
@@ -54,6 +54,20 @@ class CanvasConfigTests(unittest.TestCase):
             finally:
                 os.chdir(old_cwd)
 
+    def test_find_config_file_walks_up_from_nested_directory(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp).resolve()
+            nested = root / "courses" / "SP26-PHIL-123-codex-course" / "Week-1"
+            nested.mkdir(parents=True)
+            (root / ".canvas-config.yaml").write_text("canvas_url: https://example.instructure.com\n")
+
+            old_cwd = Path.cwd()
+            os.chdir(nested)
+            try:
+                self.assertEqual(find_config_file(), root / ".canvas-config.yaml")
+            finally:
+                os.chdir(old_cwd)
+
     def test_get_course_folder_prefix_word_boundary(self):
         with tempfile.TemporaryDirectory() as tmp:
             root = Path(tmp)
@@ -93,6 +107,45 @@ class CanvasConfigTests(unittest.TestCase):
             finally:
                 os.chdir(old_cwd)
 
+    def test_get_course_folder_prefers_longest_prefix(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / ".canvas-config.yaml").write_text(
+                yaml.dump({
+                    "canvas_url": "https://example.instructure.com",
+                    "api_token": "token",
+                    "course_folders": {"ENGL": "English", "ENGL-101": "Composition"},
+                })
+            )
+
+            old_cwd = Path.cwd()
+            os.chdir(root)
+            try:
+                self.assertEqual(get_course_folder("ENGL-101", "").parent.name, "Composition")
+                self.assertEqual(get_course_folder("ENGL-205", "").parent.name, "English")
+            finally:
+                os.chdir(old_cwd)
+
+    def test_load_config_is_cached_until_saved(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            config_path = root / ".canvas-config.yaml"
+            config_path.write_text(yaml.dump({"canvas_url": "https://a.example", "api_token": "token"}))
+
+            old_cwd = Path.cwd()
+            os.chdir(root)
+            try:
+                config = load_config()
+                config["canvas_url"] = "https://mutated.example"
+                config_path.write_text(yaml.dump({"canvas_url": "https://b.example", "api_token": "token"}))
+                self.assertEqual(load_config()["canvas_url"], "https://a.example")
+
+                save_config({"canvas_url": "https://c.example", "api_token": "token"}, config_path)
+                self.assertEqual(load_config()["canvas_url"], "https://c.example")
+            finally:
+                os.chdir(old_cwd)
+                load_config.cache_clear()
+
 
 if __name__ == "__main__":
     unittest.main()
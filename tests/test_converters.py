@@ -16,6 +16,61 @@ class ConverterTests(unittest.TestCase):
         self.assertIn("<table>", html)
         self.assertIn("scope=\"col\"", html)
 
+    def test_html_to_markdown_converts_common_elements(self):
+        html = (
+            '<h2 class="x">Week 1</h2><p>Read <strong>this</strong> and <em>that</em> &amp; '
+            '<a href="https://example.edu">the guide</a>.</p>'
+            '<ul><li>One</li><li>Two</li></ul><img src="a.png" alt="Chart"><hr/>'
+            '<pre><code>x = 1</code></pre><script>alert(1)</script>'
+        )
+        self.assertEqual(
+            html_to_markdown(html),
+            "## Week 1\nRead **this** and *that* & [the guide](https://example.edu).\n\n"
+            "- One\n- Two\n\n![Chart](a.png)\n---\n```\nx = 1\n```",
+        )
+
+    def test_html_to_markdown_heading_levels_and_stripped_blocks(self):
+        html = '<H3 class="t">Three</h3><style>p {}</style><h6>Six</h6><SCRIPT>x()</script><h1>One</h1>'
+        self.assertEqual(html_to_markdown(html), "### Three\n###### Six\n# One")
+
+    def test_markdown_to_html_converts_common_elements(self):
+        md = (
+            "# Title\n\nSome **bold** and *italic* with `a<b`.\nSecond line.\n\n"
+            "- one\n- two\n\n1. first\n2. second\n\n> quoted\n\n---\n\n"
+            "[link](https://x.edu) ![alt](i.png)"
+        )
+        self.assertEqual(
+            markdown_to_html(md),
+            "<h1>Title</h1>\n"
+            "<p>Some <strong>bold</strong> and <em>italic</em> with <code>a&lt;b</code>. Second line.</p>\n"
+            "<ul>\n<li>one</li>\n<li>two</li>\n</ul>\n"
+            "<ol>\n<li>first</li>\n<li>second</li>\n</ol>\n"
+            "<blockquote>quoted</blockquote>\n<hr />\n"
+            '<p><a href="https://x.edu">link</a> <img src="i.png" alt="alt" /></p>',
+        )
+
+    def test_markdown_to_html_passes_block_tags_and_wraps_inline_ones(self):
+        md = "<div>Block</div>\n<section>HTML</section> line\n<a href=\"x\">Link</a> text\n<em>Lead</em>\n\n12. twelve\n\n* star"
+        self.assertEqual(
+            markdown_to_html(md),
+            "<div>Block</div>\n<section>HTML</section> line\n"
+            '<p><a href="x">Link</a> text <em>Lead</em></p>\n'
+            "<ol>\n<li>twelve</li>\n</ol>\n<ul>\n<li>star</li>\n</ul>",
+        )
+
+    def test_placeholders_restore_in_place_and_lookalikes_survive(self):
+        spans = " ".join(f"`c{i}`" for i in range(12))
+        md = f"{spans} __INLINE_CODE_99__\n\n<table><tr><td>1</td></tr></table>\n\n<table><tr><td>2</td></tr></table>"
+        html = markdown_to_html(md)
+        self.assertEqual(html.count("<code>"), 12)
+        self.assertIn("<code>c11</code> __INLINE_CODE_99__", html)
+        self.assertLess(html.index("<td>1</td>"), html.index("<td>2</td>"))
+
+    def test_restored_code_is_not_scanned_for_placeholders(self):
+        html = markdown_to_html("```\nprint('__INLINE_CODE_0__')\n```\n\nUse `x`.")
+        self.assertIn("print(&#x27;__INLINE_CODE_0__&#x27;)", html)
+        self.assertEqual(html.count("<code>x</code>"), 1)
+
 
 if __name__ == "__main__":
     unittest.main()